@@ -1,5 +1,7 @@
 """Configuration settings for subtitle generator."""
+import functools
 import os
+from dataclasses import dataclass
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -7,6 +9,46 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+@dataclass(frozen=True, slots=True)
+class AudioConfig:
+    """Audio processing settings."""
+    sample_rate: int = 16000  # Hz, optimal for speech recognition
+    channels: int = 1  # Mono
+    format: str = 'wav'
+    encoding: str = 'LINEAR16'
+    gcs_chunk_size: int = 8 * 1024 * 1024  # Resumable upload chunk (multiple of 256 KiB)
+
+
+@dataclass(frozen=True, slots=True)
+class SpeechConfig:
+    """Speech recognition settings."""
+    language_code: str = 'ja-JP'  # Japanese
+    enable_word_time_offsets: bool = True
+    enable_automatic_punctuation: bool = True
+    sync_threshold_seconds: int = 60  # Use sync API for videos < 60s
+    chunk_duration_seconds: int = 300  # 5-minute chunks for very long videos
+    long_audio_mode: str = 'chunked'  # 'chunked' (parallel sync), 'long_running' or 'streaming'
+                                      # (Settings picks 'long_running' when a GCS bucket is set)
+
+
+@dataclass(frozen=True, slots=True)
+class TranslationConfig:
+    """Translation settings."""
+    source_language: str = 'ja'  # Japanese
+    target_language: str = 'zh-CN'  # Simplified Chinese (default)
+    batch_size: int = 128  # Max segments per API call
+    max_concurrency: int = 5  # Max API calls in flight at once
+
+
+@dataclass(frozen=True, slots=True)
+class SubtitleConfig:
+    """Subtitle generation settings."""
+    min_segment_duration: float = 1.0  # Minimum subtitle duration in seconds
+    max_segment_duration: float = 5.0  # Maximum subtitle duration in seconds
+    max_chars_per_segment: int = 80  # Maximum characters per subtitle line
+    min_gap_between_subtitles: float = 0.2  # Minimum gap in seconds
+
+
 class Settings:
     """Application settings and configuration."""
 
@@ -20,44 +62,27 @@ class Settings:
         # Logging configuration
         self.log_level = os.getenv('LOG_LEVEL', 'INFO')
 
-        # Temporary directory for audio files
-        self.temp_dir = Path(os.getenv('TEMP_DIR', './temp'))
-        self.temp_dir.mkdir(parents=True, exist_ok=True)
-
-        # Audio processing settings
-        self.audio_config = {
-            'sample_rate': 16000,  # Hz, optimal for speech recognition
-            'channels': 1,  # Mono
-            'format': 'wav',
-            'encoding': 'LINEAR16'
-        }
-
-        # Speech recognition settings
-        self.speech_config = {
-            'language_code': 'ja-JP',  # Japanese
-            'enable_word_time_offsets': True,
-            'enable_automatic_punctuation': True,
-            'sync_threshold_seconds': 60,  # Use sync API for videos < 60s
-            'chunk_duration_seconds': 300  # 5-minute chunks for very long videos
-        }
+        # Static configuration (immutable)
+        self.audio = AudioConfig()
+        self.translation = TranslationConfig()
+        self.subtitle = SubtitleConfig()
 
         # Google Cloud Storage settings (for large audio files > 10MB)
         self.gcs_bucket_name = os.getenv('GCS_BUCKET_NAME', None)
 
-        # Translation settings
-        self.translation_config = {
-            'source_language': 'ja',  # Japanese
-            'target_language': 'zh-CN',  # Simplified Chinese (default)
-            'batch_size': 128  # Max segments per API call
-        }
-
-        # Subtitle generation settings
-        self.subtitle_config = {
-            'min_segment_duration': 1.0,  # Minimum subtitle duration in seconds
-            'max_segment_duration': 5.0,  # Maximum subtitle duration in seconds
-            'max_chars_per_segment': 80,  # Maximum characters per subtitle line
-            'min_gap_between_subtitles': 0.2  # Minimum gap in seconds
-        }
+        # Long audio goes through the bucket with long-running operations
+        # when one is configured, otherwise it is split into sync requests
+        long_audio_mode = os.getenv('LONG_AUDIO_MODE') or (
+            'long_running' if self.gcs_bucket_name else 'chunked'
+        )
+        self.speech = SpeechConfig(long_audio_mode=long_audio_mode)
+
+    @functools.cached_property
+    def temp_dir(self):
+        """Temporary directory for audio files, created on first access."""
+        temp_dir = Path(os.getenv('TEMP_DIR', './temp'))
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        return temp_dir
 
     def validate(self):
         """Validate that required settings are configured."""
@@ -74,3 +99,9 @@ class Settings:
             )
 
         return True
+
+
+@functools.lru_cache(maxsize=None)
+def get_settings(credentials_path=None):
+    """Return the shared Settings instance for the given credentials path."""
+    return Settings(credentials_path)
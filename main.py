@@ -3,16 +3,18 @@ Chinese Subtitle Generator for Japanese Movies
 
 A CLI tool to generate Chinese subtitles from Japanese language videos.
 """
+import math
 import sys
 from pathlib import Path
 import click
 from loguru import logger
 
-from config.settings import Settings
+from config.settings import get_settings
 from src.audio_extractor import AudioExtractor
 from src.speech_recognizer import SpeechRecognizer
 from src.translator import Translator
 from src.subtitle_generator import SubtitleGenerator
+from src.pipeline import SubtitlePipeline
 from src.utils import (
     setup_logging,
     validate_video_file,
@@ -42,6 +44,18 @@ from src.utils import (
     is_flag=True,
     help='Keep temporary audio files after processing'
 )
+@click.option(
+    '--long-audio-mode',
+    type=click.Choice(SpeechRecognizer.LONG_AUDIO_MODES),
+    help='How to transcribe audio over 60s: chunked (parallel sync requests at '
+         'silences), long_running (needs GCS_BUCKET_NAME) or streaming '
+         '(default: long_running if a bucket is set, else chunked)'
+)
+@click.option(
+    '--stream',
+    is_flag=True,
+    help='Stream audio from the video straight to Speech-to-Text (videos under 5 minutes)'
+)
 @click.option(
     '-v', '--verbose',
     is_flag=True,
@@ -53,7 +67,8 @@ from src.utils import (
     type=click.Choice(['zh-CN', 'zh-TW']),
     help='Target Chinese variant: zh-CN (Simplified) or zh-TW (Traditional)'
 )
-def main(video_path, output_path, credentials_path, keep_temp, verbose, target_lang):
+def main(video_path, output_path, credentials_path, keep_temp, long_audio_mode,
+         stream, verbose, target_lang):
     """
     Generate Chinese subtitles for Japanese language movies.
 
@@ -72,12 +87,9 @@ def main(video_path, output_path, credentials_path, keep_temp, verbose, target_l
 
     try:
         # Initialize settings
-        settings = Settings(credentials_path)
+        settings = get_settings(credentials_path)
         settings.validate()
 
-        # Update target language in settings
-        settings.translation_config['target_language'] = target_lang
-
         # Generate default output path if not provided
         if not output_path:
             output_path = Path(video_path).stem + '.srt'
@@ -92,44 +104,93 @@ def main(video_path, output_path, credentials_path, keep_temp, verbose, target_l
         validate_video_file(video_path)
         logger.success("Video file validated")
 
-        # Step 2: Extract audio from video
-        logger.info("Step 2/5: Extracting audio from video...")
-        extractor = AudioExtractor(
-            sample_rate=settings.audio_config['sample_rate'],
-            channels=settings.audio_config['channels']
-        )
-        audio_path = extractor.extract_audio(video_path, settings.temp_dir)
-        duration = extractor.get_audio_duration(audio_path)
-        logger.success(f"Audio extracted: {format_duration(duration)}")
-
-        # Step 3: Transcribe Japanese audio
-        logger.info("Step 3/5: Transcribing Japanese audio to text...")
         recognizer = SpeechRecognizer(
             credentials_path=settings.credentials_path,
-            language_code=settings.speech_config['language_code'],
-            gcs_bucket_name=settings.gcs_bucket_name
-        )
-        japanese_segments = recognizer.transcribe_audio(
-            audio_path,
-            sync_threshold=settings.speech_config['sync_threshold_seconds']
+            language_code=settings.speech.language_code,
+            gcs_bucket_name=settings.gcs_bucket_name,
+            sample_rate=settings.audio.sample_rate,
+            channels=settings.audio.channels,
+            gcs_chunk_size=settings.audio.gcs_chunk_size,
+            long_audio_mode=long_audio_mode or settings.speech.long_audio_mode
         )
-        logger.success(f"Transcription complete: {len(japanese_segments)} segments")
-
-        # Step 4: Translate to Chinese
-        logger.info("Step 4/5: Translating Japanese to Chinese...")
         translator = Translator(credentials_path=settings.credentials_path)
-        chinese_segments = translator.translate_segments(
-            japanese_segments,
-            target_language=target_lang,
-            batch_size=settings.translation_config['batch_size']
+
+        extractor = AudioExtractor(
+            sample_rate=settings.audio.sample_rate,
+            channels=settings.audio.channels
         )
-        logger.success(f"Translation complete: {len(chinese_segments)} segments")
+        duration = extractor.get_audio_duration(video_path)
+        chunk_duration = settings.speech.chunk_duration_seconds
+
+        if stream and duration >= SpeechRecognizer.MAX_STREAMING_DURATION:
+            logger.warning(
+                f"Video is too long to stream ({format_duration(duration)}), "
+                f"extracting audio to a file instead"
+            )
+            stream = False
+
+        if not stream and duration > chunk_duration:
+            # Steps 2-4 overlap: while one chunk is transcribed, the next is
+            # extracted and the previous one translated
+            n_chunks = math.ceil(duration / chunk_duration)
+            logger.info(
+                f"Steps 2-4/5: Extracting, transcribing and translating "
+                f"{n_chunks} chunks in parallel..."
+            )
+            pipeline = SubtitlePipeline(
+                extractor,
+                recognizer,
+                translator,
+                temp_dir=settings.temp_dir,
+                chunk_duration=chunk_duration,
+                sync_threshold=settings.speech.sync_threshold_seconds,
+                target_language=target_lang,
+                batch_size=settings.translation.batch_size
+            )
+            chinese_segments = pipeline.run(video_path, duration)
+            logger.success(
+                f"Transcription and translation complete: {len(chinese_segments)} segments"
+            )
+        else:
+            # Step 2: Extract audio from video
+            logger.info("Step 2/5: Extracting audio from video...")
+            if stream:
+                logger.success(f"Audio will be streamed: {format_duration(duration)}")
+            else:
+                audio_path = extractor.extract_audio(video_path, settings.temp_dir)
+                duration = extractor.get_audio_duration(audio_path)
+                logger.success(f"Audio extracted: {format_duration(duration)}")
+
+            # Step 3: Transcribe Japanese audio
+            logger.info("Step 3/5: Transcribing Japanese audio to text...")
+            if stream:
+                japanese_segments = recognizer.transcribe_stream(
+                    extractor.stream_audio(video_path)
+                )
+            else:
+                japanese_segments = recognizer.transcribe_audio(
+                    audio_path,
+                    sync_threshold=settings.speech.sync_threshold_seconds,
+                    duration=duration,
+                    chunk_duration=chunk_duration
+                )
+            logger.success(f"Transcription complete: {len(japanese_segments)} segments")
+
+            # Step 4: Translate to Chinese
+            logger.info("Step 4/5: Translating Japanese to Chinese...")
+            chinese_segments = translator.translate_segments(
+                japanese_segments,
+                target_language=target_lang,
+                batch_size=settings.translation.batch_size,
+                max_concurrency=settings.translation.max_concurrency
+            )
+            logger.success(f"Translation complete: {len(chinese_segments)} segments")
 
         # Step 5: Generate SRT subtitle file
         logger.info("Step 5/5: Generating SRT subtitle file...")
         generator = SubtitleGenerator(
-            min_duration=settings.subtitle_config['min_segment_duration'],
-            max_chars=settings.subtitle_config['max_chars_per_segment']
+            min_duration=settings.subtitle.min_segment_duration,
+            max_chars=settings.subtitle.max_chars_per_segment
         )
         output_file = generator.generate_srt(chinese_segments, output_path)
         logger.success(f"Subtitle file created: {output_file}")
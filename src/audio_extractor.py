@@ -1,15 +1,116 @@
-"""Audio extraction module using MoviePy."""
+"""Audio extraction module using ffmpeg (MoviePy's bundled binary if none is installed)."""
+import functools
 import os
+import re
+import shutil
+import struct
+import subprocess
+import uuid
 from pathlib import Path
-from datetime import datetime
-from moviepy.editor import VideoFileClip
 from loguru import logger
 
 from .utils import AudioExtractionError
 
+# ffmpeg silencedetect log lines, e.g. "silence_start: 12.34"
+_SILENCE_RE = re.compile(r'silence_(start|end): (-?[\d.]+)')
+
+
+def _wav_duration(path):
+    """
+    Read the duration of a WAV file from its RIFF header.
+
+    Only the ``fmt `` and ``data`` chunk headers are read, so this costs a few
+    hundred bytes of I/O regardless of file size.
+
+    Args:
+        path: Path to WAV file
+
+    Returns:
+        float: Duration in seconds
+
+    Raises:
+        ValueError: If the file is not a PCM WAV file
+    """
+    with open(path, 'rb') as f:
+        header = f.read(12)
+        if len(header) < 12 or header[:4] != b'RIFF' or header[8:] != b'WAVE':
+            raise ValueError(f"Not a WAV file: {path}")
+
+        byte_rate = None
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                raise ValueError(f"WAV file has no data chunk: {path}")
+
+            chunk_id, chunk_size = struct.unpack('<4sI', header)
+            if chunk_id == b'fmt ':
+                fmt = f.read(16)
+                num_channels, sample_rate = struct.unpack('<HI', fmt[2:8])
+                bits_per_sample = struct.unpack('<H', fmt[14:16])[0]
+                byte_rate = sample_rate * num_channels * (bits_per_sample // 8)
+                # Skip any extension bytes (chunks are word-aligned)
+                f.seek(chunk_size - 16 + (chunk_size & 1), os.SEEK_CUR)
+            elif chunk_id == b'data':
+                if not byte_rate:
+                    raise ValueError(f"WAV data chunk precedes fmt chunk: {path}")
+                return chunk_size / byte_rate
+            else:
+                f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+
+
+@functools.lru_cache(maxsize=1)
+def _ffmpeg_binary():
+    """
+    Find the ffmpeg binary to run.
+
+    Uses ffmpeg from PATH when installed, otherwise the binary MoviePy is
+    configured with (bundled by imageio-ffmpeg).
+
+    Returns:
+        str: Path or name of the ffmpeg executable
+    """
+    if shutil.which('ffmpeg') is not None:
+        return 'ffmpeg'
+
+    from moviepy.config import get_setting
+    binary = get_setting('FFMPEG_BINARY')
+    logger.debug(f"ffmpeg not found on PATH, using MoviePy's binary: {binary}")
+    return binary
+
+
+def _probe_duration(path):
+    """
+    Read the container duration of a media file.
+
+    Uses ffprobe when installed, otherwise MoviePy's ffmpeg-based probe
+    (imageio-ffmpeg does not bundle ffprobe).
+
+    Args:
+        path: Path to audio or video file
+
+    Returns:
+        float: Duration in seconds
+    """
+    if shutil.which('ffprobe') is None:
+        from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+        return float(ffmpeg_parse_infos(str(path))['duration'])
+
+    result = subprocess.run(
+        [
+            'ffprobe', '-v', 'error',
+            '-show_entries', 'format=duration',
+            '-of', 'default=nw=1:nk=1',
+            str(path)
+        ],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return float(result.stdout.strip())
+
 
 class AudioExtractor:
-    """Extract audio from video files using MoviePy."""
+    """Extract audio from video files using ffmpeg."""
 
     def __init__(self, sample_rate=16000, channels=1):
         """
@@ -22,13 +123,15 @@ class AudioExtractor:
         self.sample_rate = sample_rate
         self.channels = channels
 
-    def extract_audio(self, video_path, temp_dir='./temp'):
+    def extract_audio(self, video_path, temp_dir='./temp', start_time=None, duration=None):
         """
         Extract audio from video and save as WAV file.
 
         Args:
             video_path: Path to input video file
             temp_dir: Directory to save temporary audio file
+            start_time: Optional start of the range to extract, in seconds
+            duration: Optional length of the range to extract, in seconds
 
         Returns:
             str: Path to extracted audio file
@@ -41,38 +144,16 @@ class AudioExtractor:
             temp_dir = Path(temp_dir)
             temp_dir.mkdir(parents=True, exist_ok=True)
 
-            # Generate unique temp filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            audio_filename = f"audio_{timestamp}.wav"
+            # Generate unique temp filename (safe for concurrent extractions)
+            audio_filename = f"audio_{uuid.uuid4().hex}.wav"
             audio_path = temp_dir / audio_filename
 
-            logger.info(f"Loading video: {video_path}")
-            video = VideoFileClip(str(video_path))
-
-            if video.audio is None:
-                raise AudioExtractionError(
-                    f"Video has no audio track: {video_path}"
-                )
-
             logger.info(
                 f"Extracting audio (sample_rate={self.sample_rate}Hz, "
                 f"channels={self.channels})..."
             )
 
-            # Extract audio and save as WAV
-            audio = video.audio
-            audio.write_audiofile(
-                str(audio_path),
-                fps=self.sample_rate,  # Sample rate
-                nbytes=2,  # 16-bit audio (2 bytes per sample)
-                codec='pcm_s16le',  # LINEAR16 encoding
-                ffmpeg_params=['-ac', str(self.channels)],  # Set channels
-                logger=None,  # Disable MoviePy's default logging
-                verbose=False
-            )
-
-            # Close video to free resources
-            video.close()
+            self._extract_with_ffmpeg(video_path, audio_path, start_time, duration)
 
             logger.success(f"Audio extracted: {audio_path}")
             return str(audio_path)
@@ -84,6 +165,187 @@ class AudioExtractor:
                 f"Failed to extract audio from {video_path}: {e}"
             )
 
+    def split_audio(self, audio_path, start_time, duration):
+        """
+        Copy a time range of a WAV file into a new file next to it.
+
+        Args:
+            audio_path: Path to source WAV file
+            start_time: Start of the range in seconds
+            duration: Length of the range in seconds
+
+        Returns:
+            str: Path to the new WAV file
+
+        Raises:
+            AudioExtractionError: If ffmpeg fails
+        """
+        audio_path = Path(audio_path)
+        chunk_path = audio_path.with_name(
+            f"{audio_path.stem}_{int(start_time * 1000):010d}.wav"
+        )
+
+        result = subprocess.run(
+            [
+                _ffmpeg_binary(), '-loglevel', 'error', '-y',
+                '-ss', str(start_time),
+                '-t', str(duration),
+                '-i', str(audio_path),
+                '-c', 'copy',
+                str(chunk_path)
+            ],
+            capture_output=True,
+            text=True
+        )
+
+        if result.returncode != 0:
+            raise AudioExtractionError(
+                f"ffmpeg failed to split {audio_path} at {start_time}s: "
+                f"{result.stderr.strip()}"
+            )
+
+        return str(chunk_path)
+
+    def detect_silences(self, audio_path, noise_db=-30, min_silence=0.3):
+        """
+        Find silent intervals in an audio file with ffmpeg's silencedetect filter.
+
+        Args:
+            audio_path: Path to audio file
+            noise_db: Level in dB below which audio counts as silence
+            min_silence: Minimum silence length in seconds
+
+        Returns:
+            List[tuple]: (start, end) of each silent interval in seconds
+
+        Raises:
+            AudioExtractionError: If ffmpeg fails
+        """
+        result = subprocess.run(
+            [
+                _ffmpeg_binary(), '-hide_banner', '-nostats',
+                '-i', str(audio_path),
+                '-af', f'silencedetect=noise={noise_db}dB:d={min_silence}',
+                '-f', 'null', '-'
+            ],
+            capture_output=True,
+            text=True
+        )
+
+        if result.returncode != 0:
+            raise AudioExtractionError(
+                f"ffmpeg failed to detect silence in {audio_path}: "
+                f"{result.stderr.strip()}"
+            )
+
+        silences = []
+        start = None
+        for kind, value in _SILENCE_RE.findall(result.stderr):
+            if kind == 'start':
+                start = max(float(value), 0.0)
+            elif start is not None:
+                silences.append((start, float(value)))
+                start = None
+
+        return silences
+
+    def stream_audio(self, video_path, frame_ms=100):
+        """
+        Decode audio from video with ffmpeg and yield raw PCM frames.
+
+        The audio is never written to disk: ffmpeg writes 16-bit little-endian
+        PCM to stdout and frames are yielded as they are decoded.
+
+        Args:
+            video_path: Path to input video file
+            frame_ms: Length of each yielded frame in milliseconds
+
+        Yields:
+            bytes: LINEAR16 audio frames
+
+        Raises:
+            AudioExtractionError: If ffmpeg fails
+        """
+        frame_size = self.sample_rate * self.channels * 2 * frame_ms // 1000
+
+        proc = subprocess.Popen(
+            [
+                _ffmpeg_binary(), '-loglevel', 'error',
+                '-i', str(video_path),
+                '-map', '0:a:0',
+                '-vn',
+                '-ac', str(self.channels),
+                '-ar', str(self.sample_rate),
+                '-acodec', 'pcm_s16le',
+                '-f', 's16le',
+                '-'
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=0
+        )
+
+        try:
+            while True:
+                frame = proc.stdout.read(frame_size)
+                if not frame:
+                    break
+                yield frame
+
+            if proc.wait() != 0:
+                raise AudioExtractionError(
+                    f"ffmpeg failed to stream audio from {video_path}: "
+                    f"{proc.stderr.read().decode(errors='replace').strip()}"
+                )
+        finally:
+            # Consumer may stop early; don't leave ffmpeg running
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+            proc.stderr.close()
+
+    def _extract_with_ffmpeg(self, video_path, audio_path, start_time=None, duration=None):
+        """
+        Extract the first audio track to 16-bit PCM WAV with a single ffmpeg call.
+
+        Args:
+            video_path: Path to input video file
+            audio_path: Path to output WAV file
+            start_time: Optional start of the range to extract, in seconds
+            duration: Optional length of the range to extract, in seconds
+
+        Raises:
+            AudioExtractionError: If ffmpeg fails or the video has no audio
+        """
+        command = [_ffmpeg_binary(), '-loglevel', 'error', '-y']
+        if start_time is not None:
+            command += ['-ss', str(start_time)]  # Seek before decoding
+        if duration is not None:
+            command += ['-t', str(duration)]
+        command += [
+            '-i', str(video_path),
+            '-map', '0:a:0',  # First audio track only
+            '-vn',
+            '-ac', str(self.channels),
+            '-ar', str(self.sample_rate),
+            '-acodec', 'pcm_s16le',  # LINEAR16 encoding
+            '-f', 'wav',
+            str(audio_path)
+        ]
+
+        result = subprocess.run(command, capture_output=True, text=True)
+
+        if result.returncode != 0:
+            if 'matches no streams' in result.stderr:
+                raise AudioExtractionError(
+                    f"Video has no audio track: {video_path}"
+                )
+            raise AudioExtractionError(
+                f"ffmpeg failed to extract audio from {video_path}: "
+                f"{result.stderr.strip()}"
+            )
+
     def get_audio_duration(self, audio_path):
         """
         Get duration of audio file in seconds.
@@ -98,13 +360,12 @@ class AudioExtractor:
             AudioExtractionError: If unable to read audio file
         """
         try:
-            from moviepy.editor import AudioFileClip
-
-            audio = AudioFileClip(audio_path)
-            duration = audio.duration
-            audio.close()
-
-            return duration
+            # Fast path: WAV files written by extract_audio carry their
+            # duration in the header, no need to decode the stream
+            try:
+                return _wav_duration(audio_path)
+            except ValueError:
+                return _probe_duration(audio_path)
 
         except Exception as e:
             raise AudioExtractionError(
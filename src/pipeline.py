@@ -0,0 +1,227 @@
+"""Pipelined subtitle generation over chunks of a long video."""
+import math
+import queue
+import threading
+from loguru import logger
+
+from .subtitle_generator import TranscriptSegment
+
+# Marks the end of a stage's output
+_DONE = object()
+
+# Chunks allowed to wait between two stages; a fast stage blocks instead of
+# running ahead (and filling the temp dir or bucket) while a slow one catches up
+_QUEUE_SIZE = 2
+
+
+class SubtitlePipeline:
+    """
+    Extract, upload, transcribe and translate a long video chunk by chunk.
+
+    Each stage runs in its own thread and hands chunks to the next stage
+    through a bounded queue, so while one chunk is being transcribed the
+    next one is already being extracted and uploaded and the previous one
+    translated.
+    """
+
+    def __init__(self, extractor, recognizer, translator, temp_dir,
+                 chunk_duration=300, sync_threshold=60,
+                 target_language='zh-CN', batch_size=128):
+        """
+        Initialize subtitle pipeline.
+
+        Args:
+            extractor: AudioExtractor used to extract each chunk
+            recognizer: SpeechRecognizer used to transcribe each chunk
+            translator: Translator used to translate each chunk
+            temp_dir: Directory to save temporary audio files
+            chunk_duration: Length of each video chunk in seconds
+            sync_threshold: Use synchronous API for chunks shorter than this (seconds)
+            target_language: Target language code for translation
+            batch_size: Number of segments to translate per API call
+        """
+        self.extractor = extractor
+        self.recognizer = recognizer
+        self.translator = translator
+        self.temp_dir = temp_dir
+        self.chunk_duration = chunk_duration
+        self.sync_threshold = sync_threshold
+        self.target_language = target_language
+        self.batch_size = batch_size
+
+        self._error = None
+
+    def run(self, video_path, duration):
+        """
+        Generate translated segments for a whole video.
+
+        Args:
+            video_path: Path to input video file
+            duration: Video duration in seconds
+
+        Returns:
+            List[TranscriptSegment]: Translated segments in video order
+
+        Raises:
+            SubtitleGeneratorError: The first error raised by any stage
+        """
+        n_chunks = math.ceil(duration / self.chunk_duration)
+        chunks = [
+            (
+                i,
+                i * self.chunk_duration,
+                min(self.chunk_duration, duration - i * self.chunk_duration)
+            )
+            for i in range(n_chunks)
+        ]
+
+        self._error = None
+        audio_queue = queue.Queue(maxsize=_QUEUE_SIZE)
+        upload_queue = queue.Queue(maxsize=_QUEUE_SIZE)
+        segment_queue = queue.Queue(maxsize=_QUEUE_SIZE)
+        results = {}
+
+        threads = [
+            threading.Thread(
+                target=self._extract_stage,
+                args=(video_path, chunks, audio_queue),
+                name='pipeline-extract'
+            ),
+            threading.Thread(
+                target=self._upload_stage,
+                args=(audio_queue, upload_queue),
+                name='pipeline-upload'
+            ),
+            threading.Thread(
+                target=self._transcribe_stage,
+                args=(upload_queue, segment_queue),
+                name='pipeline-transcribe'
+            ),
+            threading.Thread(
+                target=self._translate_stage,
+                args=(segment_queue, results),
+                name='pipeline-translate'
+            ),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if self._error is not None:
+            raise self._error
+
+        # Stages finish chunks in order, but sort anyway so the output
+        # never depends on thread scheduling
+        segments = []
+        for chunk_idx in sorted(results):
+            segments.extend(results[chunk_idx])
+        return segments
+
+    def _extract_stage(self, video_path, chunks, audio_queue):
+        """Extract each chunk's audio and pass it to the transcribe stage."""
+        try:
+            for chunk_idx, start_time, chunk_duration in chunks:
+                if self._error is not None:
+                    break
+
+                logger.info(
+                    f"Extracting chunk {chunk_idx + 1}/{len(chunks)} "
+                    f"({start_time:.0f}s - {start_time + chunk_duration:.0f}s)"
+                )
+                audio_path = self.extractor.extract_audio(
+                    video_path,
+                    self.temp_dir,
+                    start_time=start_time,
+                    duration=chunk_duration
+                )
+                audio_queue.put((chunk_idx, start_time, chunk_duration, audio_path))
+        except Exception as e:
+            self._fail(e)
+        finally:
+            audio_queue.put(_DONE)
+
+    def _upload_stage(self, audio_queue, upload_queue):
+        """Upload each chunk to Cloud Storage, if needed, for the transcribe stage."""
+        try:
+            while (item := audio_queue.get()) is not _DONE:
+                if self._error is not None:
+                    continue
+
+                chunk_idx, start_time, chunk_duration, audio_path = item
+                gcs_uri = self.recognizer.upload_audio(
+                    audio_path,
+                    sync_threshold=self.sync_threshold,
+                    duration=chunk_duration,
+                    chunk_duration=self.chunk_duration
+                )
+                upload_queue.put((chunk_idx, start_time, chunk_duration, audio_path, gcs_uri))
+        except Exception as e:
+            self._fail(e)
+            # Drain so the extract stage is never left blocked
+            while audio_queue.get() is not _DONE:
+                pass
+        finally:
+            upload_queue.put(_DONE)
+
+    def _transcribe_stage(self, upload_queue, segment_queue):
+        """Transcribe each uploaded chunk and pass it to the translate stage."""
+        try:
+            while (item := upload_queue.get()) is not _DONE:
+                chunk_idx, start_time, chunk_duration, audio_path, gcs_uri = item
+                if self._error is not None:
+                    # Don't leave chunks uploaded ahead of the failure behind
+                    if gcs_uri:
+                        self.recognizer.delete_uploaded_audio(gcs_uri)
+                    continue
+
+                segments = self.recognizer.transcribe_audio(
+                    audio_path,
+                    sync_threshold=self.sync_threshold,
+                    duration=chunk_duration,
+                    chunk_duration=self.chunk_duration,
+                    gcs_uri=gcs_uri
+                )
+
+                # Chunk timestamps are relative to the chunk start
+                segments = [
+                    TranscriptSegment(
+                        text=segment.text,
+                        start_time=segment.start_time + start_time,
+                        end_time=segment.end_time + start_time,
+                        confidence=segment.confidence
+                    )
+                    for segment in segments
+                ]
+                segment_queue.put((chunk_idx, segments))
+        except Exception as e:
+            self._fail(e)
+            # Drain so the upload stage is never left blocked
+            while (item := upload_queue.get()) is not _DONE:
+                if item[4]:
+                    self.recognizer.delete_uploaded_audio(item[4])
+        finally:
+            segment_queue.put(_DONE)
+
+    def _translate_stage(self, segment_queue, results):
+        """Translate each transcribed chunk into the results dict."""
+        try:
+            while (item := segment_queue.get()) is not _DONE:
+                if self._error is not None:
+                    continue
+
+                chunk_idx, segments = item
+                results[chunk_idx] = self.translator.translate_segments(
+                    segments,
+                    target_language=self.target_language,
+                    batch_size=self.batch_size
+                )
+        except Exception as e:
+            self._fail(e)
+            while segment_queue.get() is not _DONE:
+                pass
+
+    def _fail(self, error):
+        """Record the first error so the other stages stop early."""
+        if self._error is None:
+            self._error = error
@@ -1,13 +1,105 @@
 """Speech recognition module using Google Speech-to-Text API."""
+import asyncio
+import atexit
+import functools
+import math
+import mmap
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from google.cloud import speech
+from google.cloud import speech_v2
+from google.cloud.speech_v2.types import cloud_speech
 from google.cloud import storage
-from google.oauth2 import service_account
+from google.cloud.storage import transfer_manager
+from google.cloud.storage.retry import DEFAULT_RETRY
 from loguru import logger
 
+from .audio_extractor import AudioExtractor
 from .subtitle_generator import TranscriptSegment
-from .utils import TranscriptionError
+from .utils import TranscriptionError, grpc_transport, load_credentials
+
+
+# Japanese punctuation marks that indicate end of sentence (single code points,
+# so a segment's last character can be tested with one set lookup)
+_SENTENCE_ENDINGS = frozenset('。！？、')
+
+
+def _choose_split_points(duration, silences, target_length=50.0, max_length=55.0):
+    """
+    Pick chunk boundaries for audio, preferring the middle of silent gaps.
+
+    Args:
+        duration: Audio duration in seconds
+        silences: List of (start, end) silent intervals in seconds
+        target_length: Preferred chunk length in seconds
+        max_length: Hard upper bound on chunk length in seconds
+
+    Returns:
+        List[float]: Boundaries from 0.0 to duration (inclusive)
+    """
+    midpoints = [(start + end) / 2 for start, end in silences]
+    points = [0.0]
+
+    while duration - points[-1] > max_length:
+        last = points[-1]
+        candidates = [m for m in midpoints if last + 1.0 < m <= last + max_length]
+        if candidates:
+            # Silence closest to the preferred length
+            points.append(min(candidates, key=lambda m: abs(m - last - target_length)))
+        else:
+            # No silence in range: cut mid-speech at the preferred length
+            points.append(last + target_length)
+
+    points.append(duration)
+    return points
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_audio_duration(audio_path, mtime, size):
+    """Probe audio duration once per (path, mtime, size) combination."""
+    return AudioExtractor().get_audio_duration(audio_path)
+
+
+def _get_audio_duration(audio_path):
+    """Get audio duration, reusing the probe result if the file is unchanged."""
+    stat = os.stat(audio_path)
+    return _cached_audio_duration(str(audio_path), stat.st_mtime, stat.st_size)
+
+
+@functools.lru_cache(maxsize=4)
+def _make_speech_client(credentials_path):
+    """Create one Speech-to-Text client (and gRPC channel) per key file."""
+    return speech.SpeechClient(
+        transport=grpc_transport(speech.SpeechClient, load_credentials(credentials_path))
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _make_speech_v2_client(credentials_path):
+    """Create one Speech-to-Text v2 client (and gRPC channel) per key file."""
+    return speech_v2.SpeechClient(
+        transport=grpc_transport(speech_v2.SpeechClient, load_credentials(credentials_path))
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _make_storage_client(credentials_path):
+    """Create one Cloud Storage client per key file."""
+    return storage.Client(credentials=load_credentials(credentials_path))
+
+
+@functools.lru_cache(maxsize=1)
+def _cleanup_executor():
+    """
+    Create the executor that deletes uploaded audio, once per process.
+
+    Deletes run off the critical path; pending deletes still finish before
+    the interpreter exits.
+    """
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='gcs-cleanup')
+    atexit.register(executor.shutdown, wait=True)
+    return executor
 
 
 class SpeechRecognizer:
@@ -16,7 +108,29 @@ class SpeechRecognizer:
     # Google Speech-to-Text has a 10MB limit for inline audio content
     MAX_INLINE_SIZE = 10 * 1024 * 1024  # 10MB in bytes
 
-    def __init__(self, credentials_path, language_code='ja-JP', gcs_bucket_name=None):
+    # Streaming recognition sessions are limited to about 5 minutes of audio
+    MAX_STREAMING_DURATION = 290  # seconds, with some headroom
+
+    # Size of a canonical PCM WAV header
+    WAV_HEADER_SIZE = 44  # bytes
+
+    # Files at least this large are uploaded to GCS as parallel chunks
+    PARALLEL_UPLOAD_SIZE = 64 * 1024 * 1024  # 64MB in bytes
+    PARALLEL_UPLOAD_CHUNK_SIZE = 32 * 1024 * 1024  # 32MB in bytes
+    PARALLEL_UPLOAD_WORKERS = 8
+
+    # Maximum concurrent synchronous requests when recognizing short chunks
+    MAX_PARALLEL_REQUESTS = 8
+
+    # How often transcribe_audio_async checks a long-running operation
+    OPERATION_POLL_INTERVAL = 2.0  # seconds
+
+    # Ways to transcribe audio too long for one synchronous request
+    LONG_AUDIO_MODES = ('chunked', 'long_running', 'streaming')
+
+    def __init__(self, credentials_path, language_code='ja-JP', gcs_bucket_name=None,
+                 sample_rate=16000, channels=1, gcs_chunk_size=8 * 1024 * 1024,
+                 long_audio_mode='chunked'):
         """
         Initialize speech recognizer.
 
@@ -24,21 +138,59 @@ class SpeechRecognizer:
             credentials_path: Path to Google Cloud service account JSON key
             language_code: Language code for speech recognition (default: ja-JP)
             gcs_bucket_name: Optional Google Cloud Storage bucket for large files
+            sample_rate: Sample rate of the 16-bit PCM audio in Hz
+            channels: Number of audio channels
+            gcs_chunk_size: Resumable upload chunk size in bytes
+                (must be a multiple of 256 KiB)
+            long_audio_mode: How to transcribe audio too long for one synchronous
+                request: 'chunked' (split at silences, parallel synchronous
+                requests), 'long_running' (long-running operations) or
+                'streaming' (v2 streaming recognition from the file)
+
+        Raises:
+            TranscriptionError: If long_audio_mode is unknown or the clients
+                can't be initialized
         """
+        if long_audio_mode not in self.LONG_AUDIO_MODES:
+            raise TranscriptionError(
+                f"Unknown long audio mode '{long_audio_mode}' "
+                f"(expected one of: {', '.join(self.LONG_AUDIO_MODES)})"
+            )
+        if long_audio_mode == 'long_running' and not gcs_bucket_name:
+            logger.warning(
+                "long_running mode without a GCS bucket only works for audio "
+                "under 10MB; set GCS_BUCKET_NAME or use the chunked mode"
+            )
+
         self.language_code = language_code
         self.gcs_bucket_name = gcs_bucket_name
+        self.gcs_chunk_size = gcs_chunk_size
+        self.long_audio_mode = long_audio_mode
+        self.sample_rate = sample_rate
+        self.channels = channels
+
+        # Splits and scans audio for chunked recognition
+        self._extractor = AudioExtractor(sample_rate=sample_rate, channels=channels)
 
         # Initialize Google Speech-to-Text client with credentials
+        # (clients are shared between instances using the same key file)
         try:
-            self.credentials = service_account.Credentials.from_service_account_file(
-                credentials_path
-            )
-            self.client = speech.SpeechClient(credentials=self.credentials)
+            self.credentials = load_credentials(credentials_path)
+            self.client = _make_speech_client(credentials_path)
             logger.debug("Speech-to-Text client initialized")
 
+            if long_audio_mode == 'streaming':
+                self.client_v2 = _make_speech_v2_client(credentials_path)
+                self.recognizer_path = (
+                    f"projects/{self.credentials.project_id}"
+                    f"/locations/global/recognizers/_"
+                )
+            else:
+                self.client_v2 = None
+
             # Initialize Cloud Storage client if bucket is provided
             if gcs_bucket_name:
-                self.storage_client = storage.Client(credentials=self.credentials)
+                self.storage_client = _make_storage_client(credentials_path)
                 logger.debug(f"Cloud Storage client initialized (bucket: {gcs_bucket_name})")
             else:
                 self.storage_client = None
@@ -48,13 +200,19 @@ class SpeechRecognizer:
                 f"Failed to initialize Speech-to-Text client: {e}"
             )
 
-    def transcribe_audio(self, audio_path, sync_threshold=60):
+    def transcribe_audio(self, audio_path, sync_threshold=60, duration=None,
+                         chunk_duration=300, gcs_uri=None):
         """
         Transcribe audio file to text with timestamps.
 
         Args:
             audio_path: Path to audio file (WAV format)
             sync_threshold: Use synchronous API for videos shorter than this (seconds)
+            duration: Audio duration in seconds, if already known by the caller
+            chunk_duration: Split audio longer than this (seconds) into chunks
+                that are recognized concurrently
+            gcs_uri: GCS URI returned by upload_audio for this file, if it was
+                uploaded ahead of time (deleted once transcribed)
 
         Returns:
             List[TranscriptSegment]: Transcribed segments with timestamps
@@ -69,42 +227,236 @@ class SpeechRecognizer:
             file_size = os.path.getsize(audio_path)
             logger.info(f"Audio file size: {file_size / (1024*1024):.2f} MB")
 
-            # Get audio duration
-            from .audio_extractor import AudioExtractor
-            extractor = AudioExtractor()
-            duration = extractor.get_audio_duration(audio_path)
+            # Get audio duration (skip the probe if the caller already has it)
+            if duration is None:
+                duration = self._estimate_duration(audio_path, file_size)
             logger.info(f"Audio duration: {duration:.2f} seconds")
 
             # Configure recognition settings
-            config = speech.RecognitionConfig(
-                encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
-                sample_rate_hertz=16000,
-                language_code=self.language_code,
-                enable_word_time_offsets=True,
-                enable_automatic_punctuation=True,
+            config = self._recognition_config()
+
+            method = self._choose_method(duration, file_size, sync_threshold, chunk_duration)
+            if gcs_uri and method != 'long_running':
+                # Uploaded ahead of time, but not needed by this method
+                self._cleanup_gcs_file(gcs_uri)
+
+            if method == 'sync':
+                segments = self._transcribe_single(
+                    audio_path, file_size, config, use_sync=True
+                )
+            elif method == 'streaming':
+                segments = self._transcribe_streaming(audio_path, duration)
+            elif method == 'chunked':
+                # Split at silences into pieces short enough for synchronous
+                # recognition, no Cloud Storage or operation polling needed
+                segments = self._chunk_and_recognize(audio_path, duration, config)
+            elif method == 'long_running_chunked':
+                # Very long audio: recognize fixed-length chunks concurrently
+                segments = self._transcribe_chunked(
+                    audio_path, duration, config, chunk_duration
+                )
+            else:
+                segments = self._transcribe_single(
+                    audio_path, file_size, config, use_sync=False, gcs_uri=gcs_uri
+                )
+
+            logger.success(f"Transcription complete: {len(segments)} segments")
+            return segments
+
+        except TranscriptionError:
+            raise
+        except Exception as e:
+            raise TranscriptionError(f"Transcription failed: {e}")
+
+    async def transcribe_audio_async(self, audio_path, sync_threshold=60, duration=None,
+                                     chunk_duration=300, gcs_uri=None):
+        """
+        Transcribe audio file to text with timestamps (asyncio).
+
+        A single long-running operation is polled from the event loop instead
+        of blocking a thread until it finishes, so other work (translating a
+        previous file, extracting the next one) can run meanwhile. Other
+        recognition methods run transcribe_audio in a worker thread.
+
+        Args:
+            audio_path: Path to audio file (WAV format)
+            sync_threshold: Use synchronous API for videos shorter than this (seconds)
+            duration: Audio duration in seconds, if already known by the caller
+            chunk_duration: Split audio longer than this (seconds) into chunks
+                that are recognized concurrently
+            gcs_uri: GCS URI returned by upload_audio for this file, if it was
+                uploaded ahead of time (deleted once transcribed)
+
+        Returns:
+            List[TranscriptSegment]: Transcribed segments with timestamps
+
+        Raises:
+            TranscriptionError: If transcription fails
+        """
+        try:
+            file_size = os.path.getsize(audio_path)
+            if duration is None:
+                duration = self._estimate_duration(audio_path, file_size)
+        except Exception as e:
+            raise TranscriptionError(f"Transcription failed: {e}")
+
+        method = self._choose_method(duration, file_size, sync_threshold, chunk_duration)
+        if method != 'long_running':
+            return await asyncio.to_thread(
+                self.transcribe_audio,
+                audio_path,
+                sync_threshold=sync_threshold,
+                duration=duration,
+                chunk_duration=chunk_duration,
+                gcs_uri=gcs_uri
             )
 
-            # Determine how to send audio based on file size
-            if file_size > self.MAX_INLINE_SIZE:
-                logger.warning(
-                    f"Audio file ({file_size / (1024*1024):.2f} MB) exceeds 10MB limit. "
-                    f"Using Cloud Storage method..."
+        logger.info(f"Transcribing audio: {audio_path}")
+        try:
+            if gcs_uri:
+                audio = speech.RecognitionAudio(uri=gcs_uri)
+            else:
+                audio, gcs_uri = await asyncio.to_thread(
+                    self._prepare_audio, audio_path, file_size, False
                 )
-                audio, gcs_uri = self._prepare_audio_via_gcs(audio_path)
+
+            logger.info("Using long-running recognition (>= 60 seconds)")
+            operation = await asyncio.to_thread(
+                self.client.long_running_recognize,
+                config=self._recognition_config(),
+                audio=audio
+            )
+
+            # done() refreshes the operation over the network, so it runs
+            # in a thread too
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + 7200  # 2-hour timeout
+            while not await asyncio.to_thread(operation.done):
+                if loop.time() > deadline:
+                    raise TranscriptionError("Transcription timed out after 2 hours")
+                await asyncio.sleep(self.OPERATION_POLL_INTERVAL)
+
+            segments = self._process_response(operation.result())
+            logger.success(f"Transcription complete: {len(segments)} segments")
+            return segments
+
+        except TranscriptionError:
+            raise
+        except Exception as e:
+            raise TranscriptionError(f"Transcription failed: {e}")
+        finally:
+            if gcs_uri:
+                self._cleanup_gcs_file(gcs_uri)
+
+    def upload_audio(self, audio_path, sync_threshold=60, duration=None,
+                     chunk_duration=300):
+        """
+        Upload audio to Cloud Storage ahead of transcribe_audio, if it needs it.
+
+        Lets a caller overlap the upload of one file with the recognition of
+        another. Takes the same arguments as transcribe_audio, and uploads
+        only when transcribe_audio would send the file by URI.
+
+        Args:
+            audio_path: Path to audio file (WAV format)
+            sync_threshold: Use synchronous API for videos shorter than this (seconds)
+            duration: Audio duration in seconds, if already known by the caller
+            chunk_duration: Split audio longer than this (seconds) into chunks
+
+        Returns:
+            str: GCS URI to pass to transcribe_audio, or None if not uploaded
+
+        Raises:
+            TranscriptionError: If the upload fails
+        """
+        try:
+            file_size = os.path.getsize(audio_path)
+            if duration is None:
+                duration = self._estimate_duration(audio_path, file_size)
+        except Exception as e:
+            raise TranscriptionError(f"Failed to read audio file {audio_path}: {e}")
+
+        method = self._choose_method(duration, file_size, sync_threshold, chunk_duration)
+        if method != 'long_running':
+            return None
+        if file_size <= self.MAX_INLINE_SIZE and not self.gcs_bucket_name:
+            return None
+
+        _, gcs_uri = self._prepare_audio_via_gcs(audio_path)
+        return gcs_uri
+
+    def delete_uploaded_audio(self, gcs_uri):
+        """
+        Delete audio uploaded by upload_audio that will not be transcribed.
+
+        Args:
+            gcs_uri: GCS URI returned by upload_audio
+        """
+        self._cleanup_gcs_file(gcs_uri)
+
+    def _recognition_config(self):
+        """Build the RecognitionConfig shared by all v1 recognition methods."""
+        return speech.RecognitionConfig(
+            encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+            sample_rate_hertz=self.sample_rate,
+            audio_channel_count=self.channels,
+            language_code=self.language_code,
+            enable_word_time_offsets=True,
+            enable_automatic_punctuation=True,
+        )
+
+    def _estimate_duration(self, audio_path, file_size):
+        """
+        Get an audio file's duration in seconds.
+
+        Pipeline WAVs are 16-bit PCM, so the size alone gives the duration.
+        """
+        if str(audio_path).lower().endswith('.wav'):
+            bytes_per_second = self.sample_rate * self.channels * 2
+            return max(file_size - self.WAV_HEADER_SIZE, 0) / bytes_per_second
+        return _get_audio_duration(audio_path)
+
+    def _choose_method(self, duration, file_size, sync_threshold, chunk_duration):
+        """
+        Choose how to recognize an audio file.
+
+        Returns:
+            str: 'sync', 'streaming', 'chunked', 'long_running_chunked'
+                or 'long_running'
+        """
+        if duration < sync_threshold and file_size <= self.MAX_INLINE_SIZE:
+            return 'sync'
+        if self.long_audio_mode in ('streaming', 'chunked'):
+            return self.long_audio_mode
+        if duration > chunk_duration:
+            return 'long_running_chunked'
+        return 'long_running'
+
+    def _transcribe_single(self, audio_path, file_size, config, use_sync, gcs_uri=None):
+        """
+        Transcribe an audio file with a single recognition request.
+
+        Args:
+            audio_path: Path to audio file (WAV format)
+            file_size: Size of the audio file in bytes
+            config: RecognitionConfig to use
+            use_sync: Use synchronous recognition instead of long-running
+            gcs_uri: GCS URI of the file if it is already uploaded
+
+        Returns:
+            List[TranscriptSegment]: Transcribed segments with timestamps
+        """
+        try:
+            if gcs_uri:
+                audio = speech.RecognitionAudio(uri=gcs_uri)
             else:
-                # Load audio file inline
-                logger.info("Loading audio file inline (< 10MB)")
-                with open(audio_path, 'rb') as audio_file:
-                    content = audio_file.read()
-                audio = speech.RecognitionAudio(content=content)
-                gcs_uri = None
+                audio, gcs_uri = self._prepare_audio(audio_path, file_size, use_sync)
 
             # Choose API method based on duration
-            if duration < sync_threshold and file_size <= self.MAX_INLINE_SIZE:
+            if use_sync:
                 # Use synchronous recognition for short audio
                 logger.info("Using synchronous recognition (< 60 seconds)")
                 response = self.client.recognize(config=config, audio=audio)
-                segments = self._process_response(response)
             else:
                 # Use long-running asynchronous recognition for longer audio
                 logger.info("Using long-running recognition (>= 60 seconds)")
@@ -115,26 +467,350 @@ class SpeechRecognizer:
 
                 logger.info("Waiting for transcription to complete...")
                 response = operation.result(timeout=7200)  # 2-hour timeout
-                segments = self._process_response(response)
 
-            # Cleanup GCS file if used
+            return self._process_response(response)
+
+        finally:
+            # Cleanup GCS file if used, even when recognition failed
             if gcs_uri:
                 self._cleanup_gcs_file(gcs_uri)
 
+    def _prepare_audio(self, audio_path, file_size, use_sync):
+        """
+        Build the RecognitionAudio for a file, inline or via Cloud Storage.
+
+        Files over the inline limit must go through Cloud Storage, and audio
+        for long-running recognition is sent by URI whenever a bucket is
+        available so it never has to be loaded into memory.
+
+        Args:
+            audio_path: Path to local audio file
+            file_size: Size of the audio file in bytes
+            use_sync: Whether the audio is for synchronous recognition
+
+        Returns:
+            tuple: (RecognitionAudio object, GCS URI string or None)
+        """
+        if file_size > self.MAX_INLINE_SIZE:
+            logger.warning(
+                f"Audio file ({file_size / (1024*1024):.2f} MB) exceeds 10MB limit. "
+                f"Using Cloud Storage method..."
+            )
+            return self._prepare_audio_via_gcs(audio_path)
+
+        if not use_sync and self.gcs_bucket_name:
+            logger.info("Sending long audio via Cloud Storage")
+            return self._prepare_audio_via_gcs(audio_path)
+
+        # Load audio file inline
+        logger.info("Loading audio file inline (< 10MB)")
+        content = self._read_audio_content(audio_path)
+        return speech.RecognitionAudio(content=content), None
+
+    def _read_audio_content(self, audio_path):
+        """
+        Read an audio file for inline recognition through a memory map.
+
+        The file is copied once, straight from the page cache into the bytes
+        object handed to the request, without going through a read buffer.
+
+        Args:
+            audio_path: Path to local audio file
+
+        Returns:
+            bytes: File contents
+        """
+        with open(audio_path, 'rb') as audio_file:
+            # mmap cannot map empty files
+            if os.fstat(audio_file.fileno()).st_size == 0:
+                return b''
+
+            mm = mmap.mmap(audio_file.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                with memoryview(mm) as view:
+                    return view.tobytes()
+            finally:
+                mm.close()
+
+    def _transcribe_chunked(self, audio_path, duration, config, chunk_duration):
+        """
+        Transcribe long audio as fixed-length chunks recognized concurrently.
+
+        All long-running operations are submitted back to back and then
+        awaited together, so total wall time is roughly that of the slowest
+        chunk rather than the sum of all chunks.
+
+        Args:
+            audio_path: Path to audio file (WAV format)
+            duration: Audio duration in seconds
+            config: RecognitionConfig to use for every chunk
+            chunk_duration: Length of each chunk in seconds
+
+        Returns:
+            List[TranscriptSegment]: Segments with timestamps relative to the
+                start of the full audio
+        """
+        n_chunks = math.ceil(duration / chunk_duration)
+        logger.info(
+            f"Using long-running recognition on {n_chunks} chunks "
+            f"of {chunk_duration}s each"
+        )
+
+        chunk_paths = []
+        gcs_uris = []
+        try:
+            # Submit every chunk before waiting on any of them
+            operations = []
+            for i in range(n_chunks):
+                chunk_path = self._extractor.split_audio(
+                    audio_path, i * chunk_duration, chunk_duration
+                )
+                chunk_paths.append(chunk_path)
+
+                audio, gcs_uri = self._prepare_audio(
+                    chunk_path, os.path.getsize(chunk_path), use_sync=False
+                )
+                if gcs_uri:
+                    gcs_uris.append(gcs_uri)
+
+                logger.debug(f"Submitting chunk {i + 1}/{n_chunks}")
+                operations.append(
+                    self.client.long_running_recognize(config=config, audio=audio)
+                )
+
+            logger.info("Waiting for all chunks to complete...")
+            with ThreadPoolExecutor(max_workers=n_chunks) as executor:
+                responses = list(executor.map(
+                    lambda operation: operation.result(timeout=7200),
+                    operations
+                ))
+
+            segments = []
+            for i, response in enumerate(responses):
+                segments.extend(
+                    self._process_response(response, time_offset=i * chunk_duration)
+                )
+            return segments
+
+        finally:
+            for gcs_uri in gcs_uris:
+                self._cleanup_gcs_file(gcs_uri)
+            self._remove_chunk_files(chunk_paths)
+
+    def _chunk_and_recognize(self, audio_path, duration, config):
+        """
+        Transcribe long audio as short chunks with parallel synchronous requests.
+
+        Chunks are cut in silent gaps near 50 second marks so words are not
+        split, and each is small enough to send inline to the synchronous
+        API. Results arrive as soon as the slowest chunk is done, instead of
+        after a long-running operation finishes.
+
+        Args:
+            audio_path: Path to audio file (WAV format)
+            duration: Audio duration in seconds
+            config: RecognitionConfig to use for every chunk
+
+        Returns:
+            List[TranscriptSegment]: Segments with timestamps relative to the
+                start of the full audio
+        """
+        silences = self._extractor.detect_silences(audio_path)
+        points = _choose_split_points(duration, silences)
+        chunks = list(zip(points, points[1:]))
+        logger.info(
+            f"Using synchronous recognition on {len(chunks)} chunks "
+            f"split at silences"
+        )
+
+        def recognize_chunk(chunk_path):
+            audio = speech.RecognitionAudio(
+                content=self._read_audio_content(chunk_path)
+            )
+            return self.client.recognize(config=config, audio=audio)
+
+        chunk_paths = []
+        try:
+            for start, end in chunks:
+                chunk_paths.append(
+                    self._extractor.split_audio(audio_path, start, end - start)
+                )
+
+            with ThreadPoolExecutor(max_workers=self.MAX_PARALLEL_REQUESTS) as executor:
+                responses = list(executor.map(recognize_chunk, chunk_paths))
+
+            segments = []
+            for (start, _), response in zip(chunks, responses):
+                segments.extend(self._process_response(response, time_offset=start))
+            return segments
+
+        finally:
+            self._remove_chunk_files(chunk_paths)
+
+    def _transcribe_streaming(self, audio_path, duration):
+        """
+        Transcribe an audio file with v2 streaming recognition.
+
+        The file is sent as 100 ms frames straight from disk while results
+        come back, with no Cloud Storage upload, inline size limit or
+        operation polling. A stream is limited to about 5 minutes of audio,
+        so longer files are sent as consecutive windows, streamed
+        concurrently.
+
+        Args:
+            audio_path: Path to audio file (16-bit PCM WAV)
+            duration: Audio duration in seconds
+
+        Returns:
+            List[TranscriptSegment]: Segments with timestamps relative to the
+                start of the full audio
+        """
+        bytes_per_second = self.sample_rate * self.channels * 2
+        frame_size = bytes_per_second // 10  # 100 ms
+        window_size = self.MAX_STREAMING_DURATION * bytes_per_second
+        data_size = max(os.path.getsize(audio_path) - self.WAV_HEADER_SIZE, 0)
+
+        windows = [
+            (self.WAV_HEADER_SIZE + start, min(window_size, data_size - start))
+            for start in range(0, data_size, window_size)
+        ]
+        logger.info(f"Using streaming recognition on {len(windows)} windows")
+
+        streaming_config = cloud_speech.StreamingRecognitionConfig(
+            config=cloud_speech.RecognitionConfig(
+                explicit_decoding_config=cloud_speech.ExplicitDecodingConfig(
+                    encoding=cloud_speech.ExplicitDecodingConfig.AudioEncoding.LINEAR16,
+                    sample_rate_hertz=self.sample_rate,
+                    audio_channel_count=self.channels,
+                ),
+                language_codes=[self.language_code],
+                model='long',
+                features=cloud_speech.RecognitionFeatures(
+                    enable_word_time_offsets=True,
+                    enable_automatic_punctuation=True,
+                ),
+            )
+        )
+
+        def requests(start, size):
+            # The first request carries the config, the rest carry audio
+            yield cloud_speech.StreamingRecognizeRequest(
+                recognizer=self.recognizer_path,
+                streaming_config=streaming_config
+            )
+            with open(audio_path, 'rb') as audio_file:
+                audio_file.seek(start)
+                remaining = size
+                while remaining > 0:
+                    frame = audio_file.read(min(frame_size, remaining))
+                    if not frame:
+                        break
+                    remaining -= len(frame)
+                    yield cloud_speech.StreamingRecognizeRequest(audio=frame)
+
+        def recognize_window(window):
+            start, size = window
+            time_offset = (start - self.WAV_HEADER_SIZE) / bytes_per_second
+            responses = self.client_v2.streaming_recognize(
+                requests=requests(start, size)
+            )
+
+            segments = []
+            last_end = time_offset
+            for response in responses:
+                for result in response.results:
+                    if not result.alternatives:
+                        continue
+
+                    alternative = result.alternatives[0]
+                    end_time = time_offset + result.result_end_offset.total_seconds()
+                    if alternative.words:
+                        segments.extend(self._create_segments_from_words(
+                            alternative.words,
+                            time_offset=time_offset,
+                            start_field='start_offset',
+                            end_field='end_offset'
+                        ))
+                    else:
+                        # No word timings: the result spans from the end of
+                        # the previous one
+                        segments.append(
+                            TranscriptSegment(
+                                text=alternative.transcript,
+                                start_time=last_end,
+                                end_time=end_time,
+                                confidence=alternative.confidence
+                            )
+                        )
+                    last_end = end_time
+            return segments
+
+        with ThreadPoolExecutor(max_workers=self.MAX_PARALLEL_REQUESTS) as executor:
+            results = list(executor.map(recognize_window, windows))
+
+        return [segment for window_segments in results for segment in window_segments]
+
+    def _remove_chunk_files(self, chunk_paths):
+        """Delete temporary chunk files, logging any that can't be removed."""
+        for chunk_path in chunk_paths:
+            try:
+                os.remove(chunk_path)
+            except OSError as e:
+                logger.warning(f"Failed to remove {chunk_path}: {e}")
+
+    def transcribe_stream(self, audio_frames):
+        """
+        Transcribe a stream of raw audio frames with the streaming API.
+
+        Frames are sent as they arrive, so audio piped from ffmpeg never has
+        to be written to disk or held in memory as a whole.
+
+        Args:
+            audio_frames: Iterable of LINEAR16 audio frames (bytes)
+
+        Returns:
+            List[TranscriptSegment]: Transcribed segments with timestamps
+
+        Raises:
+            TranscriptionError: If transcription fails
+        """
+        try:
+            logger.info("Transcribing audio stream (streaming recognition)")
+
+            config = self._recognition_config()
+            streaming_config = speech.StreamingRecognitionConfig(
+                config=config,
+                interim_results=False
+            )
+
+            requests = (
+                speech.StreamingRecognizeRequest(audio_content=frame)
+                for frame in audio_frames
+            )
+            responses = self.client.streaming_recognize(
+                config=streaming_config,
+                requests=requests
+            )
+
+            segments = []
+            for response in responses:
+                segments.extend(self._process_response(response))
+
             logger.success(f"Transcription complete: {len(segments)} segments")
             return segments
 
         except TranscriptionError:
             raise
         except Exception as e:
-            raise TranscriptionError(f"Transcription failed: {e}")
+            raise TranscriptionError(f"Streaming transcription failed: {e}")
 
-    def _process_response(self, response):
+    def _process_response(self, response, time_offset=0.0):
         """
         Process Google Speech-to-Text API response and create segments.
 
         Args:
             response: API response object
+            time_offset: Seconds to add to every timestamp (for audio chunks)
 
         Returns:
             List[TranscriptSegment]: Processed segments with timestamps
@@ -150,13 +826,14 @@ class SpeechRecognizer:
             # If word time offsets are available, create segments from words
             if alternative.words:
                 word_segments = self._create_segments_from_words(
-                    alternative.words
+                    alternative.words,
+                    time_offset=time_offset
                 )
                 segments.extend(word_segments)
             else:
                 # Fallback: create single segment for entire result
                 # Estimate timing based on result index
-                start_time = len(segments) * 3.0  # Rough estimate
+                start_time = time_offset + len(segments) * 3.0  # Rough estimate
                 end_time = start_time + 3.0
                 segments.append(
                     TranscriptSegment(
@@ -193,10 +870,30 @@ class SpeechRecognizer:
             # Upload file to GCS
             bucket = self.storage_client.bucket(self.gcs_bucket_name)
             blob_name = f"audio_temp/{Path(audio_path).name}"
-            blob = bucket.blob(blob_name)
-
             logger.info(f"Uploading audio to GCS: gs://{self.gcs_bucket_name}/{blob_name}")
-            blob.upload_from_filename(audio_path)
+            if os.path.getsize(audio_path) >= self.PARALLEL_UPLOAD_SIZE:
+                # Chunks go up concurrently as one XML API multipart upload,
+                # so bandwidth is not limited to a single TCP stream
+                transfer_manager.upload_chunks_concurrently(
+                    audio_path,
+                    bucket.blob(blob_name),
+                    content_type='audio/wav',
+                    chunk_size=self.PARALLEL_UPLOAD_CHUNK_SIZE,
+                    deadline=600,
+                    worker_type=transfer_manager.THREAD,  # I/O bound, no pickling
+                    max_workers=self.PARALLEL_UPLOAD_WORKERS
+                )
+            else:
+                # Setting a chunk size makes this a resumable upload: a failed
+                # chunk is retried on its own instead of restarting the file
+                blob = bucket.blob(blob_name, chunk_size=self.gcs_chunk_size)
+                blob.upload_from_filename(
+                    audio_path,
+                    content_type='audio/wav',
+                    checksum='crc32c',
+                    timeout=(30, 600),  # (connect, read) seconds per request
+                    retry=DEFAULT_RETRY  # Exponential backoff on 5xx/connection errors
+                )
 
             # Create GCS URI
             gcs_uri = f"gs://{self.gcs_bucket_name}/{blob_name}"
@@ -211,6 +908,18 @@ class SpeechRecognizer:
             raise TranscriptionError(f"Failed to upload audio to Cloud Storage: {e}")
 
     def _cleanup_gcs_file(self, gcs_uri):
+        """
+        Delete temporary file from Google Cloud Storage in the background.
+
+        Nothing waits on the DELETE, so it runs on the shared cleanup
+        executor instead of adding a round trip to every transcription.
+
+        Args:
+            gcs_uri: GCS URI (e.g., gs://bucket/path/to/file)
+        """
+        _cleanup_executor().submit(self._delete_gcs_file, gcs_uri)
+
+    def _delete_gcs_file(self, gcs_uri):
         """
         Delete temporary file from Google Cloud Storage.
 
@@ -238,7 +947,9 @@ class SpeechRecognizer:
         except Exception as e:
             logger.warning(f"Failed to cleanup GCS file {gcs_uri}: {e}")
 
-    def _create_segments_from_words(self, word_info_list, max_duration=5.0, max_chars=80):
+    def _create_segments_from_words(self, word_info_list, max_duration=5.0, max_chars=80,
+                                    time_offset=0.0, start_field='start_time',
+                                    end_field='end_time'):
         """
         Group words into subtitle segments with optimal timing.
 
@@ -246,6 +957,11 @@ class SpeechRecognizer:
             word_info_list: List of WordInfo objects from API
             max_duration: Maximum segment duration in seconds
             max_chars: Maximum characters per segment
+            time_offset: Seconds to add to every word timestamp
+            start_field: WordInfo field with the word start time
+                ('start_offset' for the v2 API)
+            end_field: WordInfo field with the word end time
+                ('end_offset' for the v2 API)
 
         Returns:
             List[TranscriptSegment]: Grouped segments
@@ -253,34 +969,31 @@ class SpeechRecognizer:
         if not word_info_list:
             return []
 
-        segments = []
-        current_words = []
-        current_start = None
-        current_end = None
-
-        # Japanese punctuation marks that indicate end of sentence
-        sentence_endings = {'。', '！', '？', '、'}
-
-        for word_info in word_info_list:
-            # Convert Duration to float seconds
-            start_sec = (
-                word_info.start_time.seconds +
-                word_info.start_time.microseconds / 1e6
-            )
-            end_sec = (
-                word_info.end_time.seconds +
-                word_info.end_time.microseconds / 1e6
-            )
+        # Convert word timings to float seconds once, up front
+        words = [word_info.word for word_info in word_info_list]
+        starts = [
+            time_offset + t.seconds + t.microseconds / 1e6
+            for t in (getattr(w, start_field) for w in word_info_list)
+        ]
+        ends = [
+            time_offset + t.seconds + t.microseconds / 1e6
+            for t in (getattr(w, end_field) for w in word_info_list)
+        ]
 
-            if current_start is None:
-                current_start = start_sec
+        segments = []
+        seg_start = 0
+        cur_chars = 0
+        last_char = ''
 
-            current_words.append(word_info.word)
-            current_end = end_sec
+        for i, word in enumerate(words):
+            # Track length and final character instead of joining the text;
+            # empty words don't change how the segment text ends
+            cur_chars += len(word)
+            if word:
+                last_char = word[-1]
 
             # Calculate current segment stats
-            duration = current_end - current_start
-            text = ''.join(current_words)
+            duration = ends[i] - starts[seg_start]
 
             # Determine if we should finalize this segment
             should_finalize = False
@@ -288,37 +1001,36 @@ class SpeechRecognizer:
             # Check various conditions for segment finalization
             if duration >= max_duration:
                 should_finalize = True
-            elif len(text) >= max_chars:
+            elif cur_chars >= max_chars:
                 should_finalize = True
-            elif any(text.endswith(punct) for punct in sentence_endings):
+            elif last_char in _SENTENCE_ENDINGS:
                 # End on sentence punctuation if we have reasonable length
-                if len(text) > 10 or duration > 1.0:
+                if cur_chars > 10 or duration > 1.0:
                     should_finalize = True
 
             if should_finalize:
-                # Create segment
+                # Create segment, joining its words only once
                 segments.append(
                     TranscriptSegment(
-                        text=text,
-                        start_time=current_start,
-                        end_time=current_end,
+                        text=''.join(words[seg_start:i + 1]),
+                        start_time=starts[seg_start],
+                        end_time=ends[i],
                         confidence=1.0
                     )
                 )
 
-                # Reset for next segment
-                current_words = []
-                current_start = None
-                current_end = None
+                # Next segment starts at the following word
+                seg_start = i + 1
+                cur_chars = 0
+                last_char = ''
 
         # Handle remaining words
-        if current_words:
-            text = ''.join(current_words)
+        if seg_start < len(words):
             segments.append(
                 TranscriptSegment(
-                    text=text,
-                    start_time=current_start,
-                    end_time=current_end,
+                    text=''.join(words[seg_start:]),
+                    start_time=starts[seg_start],
+                    end_time=ends[-1],
                     confidence=1.0
                 )
             )
@@ -4,6 +4,9 @@ from dataclasses import dataclass
 from typing import List
 from loguru import logger
 
+# Zero-padded two-digit strings for timestamp fields
+_PAD2 = [f"{i:02d}" for i in range(100)]
+
 
 @dataclass
 class TranscriptSegment:
@@ -77,12 +80,13 @@ class SubtitleGenerator:
         Returns:
             str: Formatted timestamp (e.g., "00:01:05,500")
         """
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millisecs = int((seconds % 1) * 1000)
+        # Integer milliseconds, so the fields can't disagree on rounding
+        secs, millisecs = divmod(round(seconds * 1000), 1000)
+        minutes, secs = divmod(secs, 60)
+        hours, minutes = divmod(minutes, 60)
 
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millisecs:03d}"
+        hours_str = _PAD2[hours] if hours < 100 else str(hours)
+        return f"{hours_str}:{_PAD2[minutes]}:{_PAD2[secs]},{millisecs:03d}"
 
     def _merge_short_segments(self, segments):
         """
@@ -99,6 +103,8 @@ class SubtitleGenerator:
 
         merged = []
         current = None
+        parts = []  # Texts merged into current, joined once it's finalized
+        text_len = 0  # Length of the joined text
 
         for segment in segments:
             if current is None:
@@ -108,26 +114,30 @@ class SubtitleGenerator:
                     end_time=segment.end_time,
                     confidence=segment.confidence
                 )
+                parts = [segment.text]
+                text_len = len(segment.text)
                 continue
 
             duration = current.end_time - current.start_time
-            combined_text = current.text + " " + segment.text
+            combined_len = text_len + 1 + len(segment.text)
 
             # Check if we should merge with current segment
             should_merge = (
                 duration < self.min_duration or  # Current too short
                 (
-                    len(combined_text) <= self.max_chars and  # Won't exceed max chars
+                    combined_len <= self.max_chars and  # Won't exceed max chars
                     segment.start_time - current.end_time < 1.0  # Close timing
                 )
             )
 
             if should_merge:
                 # Merge with current segment
-                current.text = combined_text
+                parts.append(segment.text)
+                text_len = combined_len
                 current.end_time = segment.end_time
             else:
                 # Finalize current segment and start new one
+                current.text = ' '.join(parts)
                 merged.append(current)
                 current = TranscriptSegment(
                     text=segment.text,
@@ -135,9 +145,12 @@ class SubtitleGenerator:
                     end_time=segment.end_time,
                     confidence=segment.confidence
                 )
+                parts = [segment.text]
+                text_len = len(segment.text)
 
         # Add the last segment
         if current is not None:
+            current.text = ' '.join(parts)
             merged.append(current)
 
         logger.debug(f"Merged {len(segments)} segments into {len(merged)} segments")
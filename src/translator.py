@@ -1,16 +1,37 @@
 """Translation module using Google Translate API."""
+import asyncio
+import functools
+import hashlib
 import time
-from google.cloud import translate_v2 as translate
-from google.oauth2 import service_account
+from concurrent.futures import ThreadPoolExecutor
+from google.cloud import translate_v3
 from loguru import logger
 
 from .subtitle_generator import TranscriptSegment
-from .utils import TranslationError, APIQuotaExceeded
+from .utils import TranslationError, APIQuotaExceeded, grpc_transport, load_credentials
+
+# Joins short texts into one translate() value; the marker is left untranslated
+_SEGMENT_MARKER = '<<<SEG>>>'
+_SEGMENT_SEPARATOR = f'\n{_SEGMENT_MARKER}\n'
+
+# Log translation progress every this many batches
+_PROGRESS_INTERVAL = 10
+
+
+@functools.lru_cache(maxsize=4)
+def _make_translate_client(credentials_path):
+    """Create one Translation client (and gRPC channel) per key file."""
+    client_class = translate_v3.TranslationServiceClient
+    return client_class(
+        transport=grpc_transport(client_class, load_credentials(credentials_path))
+    )
 
 
 class Translator:
     """Translate text using Google Translate API."""
 
+    MAX_JOINED_CHARS = 5000  # Max characters per joined translate() value
+
     def __init__(self, credentials_path):
         """
         Initialize translator.
@@ -18,25 +39,37 @@ class Translator:
         Args:
             credentials_path: Path to Google Cloud service account JSON key
         """
+        # Initialize client with credentials
+        # (clients are shared between instances using the same key file)
         try:
-            credentials = service_account.Credentials.from_service_account_file(
-                credentials_path
-            )
-            self.client = translate.Client(credentials=credentials)
+            self.credentials = load_credentials(credentials_path)
+            # gRPC client: protobuf responses, one HTTP/2 connection
+            self.client = _make_translate_client(credentials_path)
+            self.parent = f"projects/{self.credentials.project_id}/locations/global"
             logger.debug("Translate API client initialized")
+
+            # Translations already fetched, keyed on (target language, text)
+            self._cache = {}
         except Exception as e:
             raise TranslationError(
                 f"Failed to initialize Translate API client: {e}"
             )
 
-    def translate_segments(self, segments, target_language='zh-CN', batch_size=128):
+    def translate_segments(self, segments, target_language='zh-CN', batch_size=128,
+                           max_concurrency=5):
         """
         Translate transcript segments from Japanese to target language.
 
+        Texts already translated by this Translator are taken from its cache,
+        and repeated texts are sent only once. Batches are sent concurrently
+        (up to max_concurrency requests in flight) and reassembled in their
+        original order.
+
         Args:
             segments: List of TranscriptSegment objects with Japanese text
             target_language: Target language code (default: zh-CN for Simplified Chinese)
             batch_size: Number of segments to translate per API call
+            max_concurrency: Maximum number of API calls in flight at once
 
         Returns:
             List[TranscriptSegment]: New segments with translated text, same timestamps
@@ -49,44 +82,185 @@ class Translator:
 
         logger.info(f"Translating {len(segments)} segments to {target_language}...")
 
-        translated_segments = []
+        translations, pending = self._split_cached(segments, target_language)
 
-        # Process in batches for efficiency
-        for i in range(0, len(segments), batch_size):
-            batch = segments[i:i + batch_size]
-            batch_num = i // batch_size + 1
-            total_batches = (len(segments) + batch_size - 1) // batch_size
+        # Split remaining texts into batches for efficiency
+        batches = [
+            pending[i:i + batch_size]
+            for i in range(0, len(pending), batch_size)
+        ]
+        total_batches = len(batches)
 
-            logger.info(f"Translating batch {batch_num}/{total_batches}...")
+        if batches:
+            logger.debug(f"Sending {len(pending)} texts in {total_batches} batches")
+            with ThreadPoolExecutor(max_workers=min(max_concurrency, total_batches)) as executor:
+                # Translate batches with retry logic, all submitted up front
+                futures = [
+                    executor.submit(
+                        self._translate_batch_with_retry,
+                        [text for _, text, _ in batch],
+                        target_language=target_language
+                    )
+                    for batch in batches
+                ]
 
-            # Extract texts from segments
-            texts = [seg.text for seg in batch]
+                try:
+                    for batch_num, (batch, future) in enumerate(zip(batches, futures), start=1):
+                        self._store_translations(batch, future.result(), translations)
+                        if batch_num % _PROGRESS_INTERVAL == 0 or batch_num == total_batches:
+                            logger.info(f"Translated batch {batch_num}/{total_batches}")
+                except Exception:
+                    # Don't keep calling the API (e.g. after quota is exceeded)
+                    for future in futures:
+                        future.cancel()
+                    raise
 
-            # Translate batch with retry logic
-            translated_texts = self._translate_batch_with_retry(
-                texts,
-                target_language=target_language
-            )
+        translated_segments = self._build_segments(segments, translations)
+        logger.success(f"Translation complete: {len(translated_segments)} segments")
+        return translated_segments
+
+    async def translate_segments_async(self, segments, target_language='zh-CN',
+                                       batch_size=128, max_concurrency=5):
+        """
+        Translate transcript segments from Japanese to target language (asyncio).
+
+        Uses the gRPC Translation v3 async client: all batches are in flight
+        on one HTTP/2 connection, bounded by a semaphore, without a thread
+        per request. Shares the translation cache with translate_segments.
+
+        Args:
+            segments: List of TranscriptSegment objects with Japanese text
+            target_language: Target language code (default: zh-CN for Simplified Chinese)
+            batch_size: Number of segments to translate per API call
+            max_concurrency: Maximum number of API calls in flight at once
+
+        Returns:
+            List[TranscriptSegment]: New segments with translated text, same timestamps
+
+        Raises:
+            TranslationError: If translation fails
+        """
+        if not segments:
+            return []
+
+        logger.info(f"Translating {len(segments)} segments to {target_language}...")
+
+        translations, pending = self._split_cached(segments, target_language)
+        batches = [
+            pending[i:i + batch_size]
+            for i in range(0, len(pending), batch_size)
+        ]
 
-            # Create new segments with translated text but original timestamps
-            for segment, translated_text in zip(batch, translated_texts):
-                translated_segments.append(
-                    TranscriptSegment(
-                        text=translated_text,
-                        start_time=segment.start_time,
-                        end_time=segment.end_time,
-                        confidence=segment.confidence
+        if batches:
+            # gRPC asyncio channels are bound to the running event loop, so
+            # the client is created per call rather than in __init__
+            client = translate_v3.TranslationServiceAsyncClient(credentials=self.credentials)
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            tasks = [
+                asyncio.ensure_future(
+                    self._translate_batch_async(
+                        client,
+                        semaphore,
+                        [text for _, text, _ in batch],
+                        target_language=target_language
                     )
                 )
+                for batch in batches
+            ]
+
+            try:
+                translated_batches = await asyncio.gather(*tasks)
+            except Exception:
+                # Don't keep calling the API (e.g. after quota is exceeded)
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+            finally:
+                # The client is per call, so close its channel with it
+                await client.transport.close()
+
+            for batch, translated_texts in zip(batches, translated_batches):
+                self._store_translations(batch, translated_texts, translations)
 
+        translated_segments = self._build_segments(segments, translations)
         logger.success(f"Translation complete: {len(translated_segments)} segments")
         return translated_segments
 
-    def _translate_batch_with_retry(self, texts, target_language, max_retries=3):
+    def _cache_key(self, target_language, text):
+        """Build a translation cache key, hashing long texts to bound memory."""
+        if len(text) > 64:
+            text = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+        return target_language, text
+
+    def _split_cached(self, segments, target_language):
+        """
+        Look up segment texts in the translation cache.
+
+        Texts without any letters are passed through as their own
+        translation instead of being sent to the API.
+
+        Args:
+            segments: List of TranscriptSegment objects with Japanese text
+            target_language: Target language code
+
+        Returns:
+            tuple: (list of translations with None where not yet known,
+                list of (cache key, text, segment indices) for each distinct
+                uncached text)
         """
-        Translate a batch of texts with exponential backoff retry.
+        translations = [None] * len(segments)
+        pending = {}
+
+        for i, segment in enumerate(segments):
+            if not any(c.isalpha() for c in segment.text):
+                # Blank, numbers or punctuation only: nothing to translate
+                translations[i] = segment.text
+                continue
+
+            key = self._cache_key(target_language, segment.text)
+            cached = self._cache.get(key)
+            if cached is not None:
+                translations[i] = cached
+            elif key in pending:
+                pending[key][2].append(i)
+            else:
+                pending[key] = (key, segment.text, [i])
+
+        skipped = len(segments) - sum(len(indices) for _, _, indices in pending.values())
+        if skipped:
+            logger.debug(f"Segments not sent (cached or no text): {skipped}/{len(segments)}")
+
+        return translations, list(pending.values())
+
+    def _store_translations(self, batch, translated_texts, translations):
+        """Cache a batch's translations and fill them in for every matching segment."""
+        for (key, _, indices), translated_text in zip(batch, translated_texts):
+            self._cache[key] = translated_text
+            for i in indices:
+                translations[i] = translated_text
+
+    def _build_segments(self, segments, translations):
+        """Create new segments with translated text but original timestamps."""
+        return [
+            TranscriptSegment(
+                text=translated_text,
+                start_time=segment.start_time,
+                end_time=segment.end_time,
+                confidence=segment.confidence
+            )
+            for segment, translated_text in zip(segments, translations)
+        ]
+
+    async def _translate_batch_async(self, client, semaphore, texts, target_language,
+                                     max_retries=3):
+        """
+        Translate a batch of texts with the async client and exponential backoff.
 
         Args:
+            client: TranslationServiceAsyncClient to use
+            semaphore: Semaphore bounding concurrent API calls
             texts: List of text strings to translate
             target_language: Target language code
             max_retries: Maximum number of retry attempts
@@ -100,19 +274,133 @@ class Translator:
         """
         for attempt in range(max_retries):
             try:
-                # Call Google Translate API
-                results = self.client.translate(
-                    texts,
-                    target_language=target_language,
-                    source_language='ja'  # Japanese
+                async with semaphore:
+                    response = await client.translate_text(
+                        parent=self.parent,
+                        contents=texts,
+                        source_language_code='ja',  # Japanese
+                        target_language_code=target_language,
+                        mime_type='text/plain'
+                    )
+                return [t.translated_text for t in response.translations]
+
+            except Exception as e:
+                error_msg = str(e).lower()
+
+                # Check for quota exceeded error
+                if 'quota' in error_msg or 'limit' in error_msg:
+                    raise APIQuotaExceeded(
+                        f"Google Translate API quota exceeded: {e}"
+                    )
+
+                # Check if this is the last attempt
+                if attempt == max_retries - 1:
+                    raise TranslationError(
+                        f"Translation failed after {max_retries} attempts: {e}"
+                    )
+
+                # Calculate exponential backoff delay
+                delay = (2 ** attempt) * 1  # 1, 2, 4 seconds
+                logger.warning(
+                    f"Translation attempt {attempt + 1} failed: {e}. "
+                    f"Retrying in {delay} seconds..."
+                )
+                await asyncio.sleep(delay)
+
+        raise TranslationError("Translation failed: max retries exceeded")
+
+    def _translate_batch_with_retry(self, texts, target_language, max_retries=3):
+        """
+        Translate a batch of texts, joining short texts into single strings.
+
+        Adjacent texts are joined with a separator line into strings of at
+        most MAX_JOINED_CHARS characters, so the API parses one value instead
+        of many tiny ones. If a translation does not split back into the
+        expected number of texts, that group is retranslated item by item.
+
+        Args:
+            texts: List of text strings to translate
+            target_language: Target language code
+            max_retries: Maximum number of retry attempts
+
+        Returns:
+            List[str]: Translated texts
+
+        Raises:
+            TranslationError: If all retries fail
+            APIQuotaExceeded: If quota is exceeded
+        """
+        translated = []
+
+        for group in self._group_texts(texts):
+            if len(group) == 1:
+                translated.extend(
+                    self._translate_with_retry(group, target_language, max_retries)
                 )
+                continue
+
+            joined = _SEGMENT_SEPARATOR.join(group)
+            result = self._translate_with_retry([joined], target_language, max_retries)[0]
+            parts = [part.strip() for part in result.split(_SEGMENT_MARKER)]
+
+            if len(parts) != len(group):
+                logger.debug(
+                    f"Joined translation split into {len(parts)} parts, "
+                    f"expected {len(group)}; translating items separately"
+                )
+                parts = self._translate_with_retry(group, target_language, max_retries)
+            translated.extend(parts)
+
+        return translated
+
+    def _group_texts(self, texts):
+        """Group adjacent texts so each joined group fits in MAX_JOINED_CHARS."""
+        groups = []
+        group = []
+        group_len = 0
+
+        for text in texts:
+            added_len = len(text) + (len(_SEGMENT_SEPARATOR) if group else 0)
+            if group and group_len + added_len > self.MAX_JOINED_CHARS:
+                groups.append(group)
+                group = []
+                group_len = 0
+                added_len = len(text)
+            group.append(text)
+            group_len += added_len
+
+        if group:
+            groups.append(group)
+        return groups
 
-                # Extract translated text from results
-                # Results can be a single dict or list of dicts
-                if isinstance(results, dict):
-                    return [results['translatedText']]
-                else:
-                    return [r['translatedText'] for r in results]
+    def _translate_with_retry(self, values, target_language, max_retries=3):
+        """
+        Translate a list of strings with exponential backoff retry.
+
+        Args:
+            values: List of strings to send in one API call
+            target_language: Target language code
+            max_retries: Maximum number of retry attempts
+
+        Returns:
+            List[str]: Translated strings
+
+        Raises:
+            TranslationError: If all retries fail
+            APIQuotaExceeded: If quota is exceeded
+        """
+        for attempt in range(max_retries):
+            try:
+                # Call Google Translate API; plain text keeps the separator
+                # (and any quotes or ampersands) from being HTML-escaped
+                response = self.client.translate_text(
+                    parent=self.parent,
+                    contents=values,
+                    source_language_code='ja',  # Japanese
+                    target_language_code=target_language,
+                    mime_type='text/plain'
+                )
+                return [t.translated_text for t in response.translations]
 
             except Exception as e:
                 error_msg = str(e).lower()
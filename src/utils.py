@@ -1,10 +1,22 @@
 """Utility functions and custom exceptions."""
+import functools
 import os
 import sys
 from pathlib import Path
+from google.oauth2 import service_account
 from loguru import logger
 
 
+# Ping idle gRPC channels so they survive the gaps between videos
+GRPC_CHANNEL_OPTIONS = [('grpc.keepalive_time_ms', 60000)]
+
+# Common video extensions
+_VIDEO_EXTENSIONS = frozenset({
+    '.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv',
+    '.webm', '.m4v', '.mpg', '.mpeg', '.3gp'
+})
+
+
 # Custom Exceptions
 class SubtitleGeneratorError(Exception):
     """Base exception for subtitle generator."""
@@ -78,22 +90,16 @@ def validate_video_file(path):
     """
     path = Path(path)
 
-    if not path.exists():
-        raise VideoFileError(f"Video file not found: {path}")
-
+    # One stat for the common case; only a failure checks which error it is
     if not path.is_file():
+        if not path.exists():
+            raise VideoFileError(f"Video file not found: {path}")
         raise VideoFileError(f"Path is not a file: {path}")
 
-    # Common video extensions
-    valid_extensions = {
-        '.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv',
-        '.webm', '.m4v', '.mpg', '.mpeg', '.3gp'
-    }
-
-    if path.suffix.lower() not in valid_extensions:
+    if path.suffix.lower() not in _VIDEO_EXTENSIONS:
         raise VideoFileError(
             f"Unsupported video format: {path.suffix}. "
-            f"Supported formats: {', '.join(valid_extensions)}"
+            f"Supported formats: {', '.join(sorted(_VIDEO_EXTENSIONS))}"
         )
 
     return True
@@ -106,17 +112,22 @@ def cleanup_temp_files(temp_dir):
     Args:
         temp_dir: Path to temporary directory
     """
-    temp_dir = Path(temp_dir)
-    if not temp_dir.exists():
+    try:
+        entries = os.scandir(temp_dir)
+    except FileNotFoundError:
         return
 
-    # Remove all .wav files in temp directory
-    for audio_file in temp_dir.glob("*.wav"):
-        try:
-            audio_file.unlink()
-            logger.debug(f"Removed temporary file: {audio_file}")
-        except Exception as e:
-            logger.warning(f"Failed to remove {audio_file}: {e}")
+    # Remove all .wav files in temp directory (scandir entries carry the
+    # file type, so no extra stat per file)
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith('.wav') or not entry.is_file(follow_symlinks=False):
+                continue
+            try:
+                os.unlink(entry.path)
+                logger.debug(f"Removed temporary file: {entry.path}")
+            except OSError as e:
+                logger.warning(f"Failed to remove {entry.path}: {e}")
 
 
 def format_duration(seconds):
@@ -129,9 +140,8 @@ def format_duration(seconds):
     Returns:
         str: Formatted duration (e.g., "2h 35m 10s")
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
 
     parts = []
     if hours > 0:
@@ -142,3 +152,36 @@ def format_duration(seconds):
         parts.append(f"{secs}s")
 
     return " ".join(parts)
+
+
+@functools.lru_cache(maxsize=4)
+def load_credentials(credentials_path):
+    """
+    Load service account credentials once per key file.
+
+    Args:
+        credentials_path: Path to Google Cloud service account JSON key
+
+    Returns:
+        service_account.Credentials: Credentials shared by all clients
+    """
+    return service_account.Credentials.from_service_account_file(credentials_path)
+
+
+def grpc_transport(client_class, credentials):
+    """
+    Build a gRPC transport for a Google Cloud client on a keepalive channel.
+
+    Args:
+        client_class: Client class, e.g. speech.SpeechClient
+        credentials: Credentials for the channel
+
+    Returns:
+        Transport to pass as the client's transport argument
+    """
+    transport_class = client_class.get_transport_class('grpc')
+    channel = transport_class.create_channel(
+        credentials=credentials,
+        options=GRPC_CHANNEL_OPTIONS
+    )
+    return transport_class(channel=channel)
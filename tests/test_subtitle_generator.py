@@ -41,6 +41,12 @@ class TestSubtitleGenerator:
         assert generator._format_timestamp(3661.5) == "01:01:01,500"
         assert generator._format_timestamp(7322.25) == "02:02:02,250"
 
+    def test_format_timestamp_rounding(self):
+        """Test milliseconds rounding up into the next second."""
+        generator = SubtitleGenerator()
+        assert generator._format_timestamp(59.9996) == "00:01:00,000"
+        assert generator._format_timestamp(3599.9999) == "01:00:00,000"
+
     def test_merge_short_segments(self):
         """Test merging of short segments."""
         generator = SubtitleGenerator(min_duration=2.0)
@@ -0,0 +1,188 @@
+"""Tests for translator module."""
+import pytest
+from types import SimpleNamespace
+
+pytest.importorskip('google.cloud.translate_v3')
+
+from src.translator import Translator, _SEGMENT_MARKER, _SEGMENT_SEPARATOR
+from src.subtitle_generator import TranscriptSegment
+
+
+class FakeTranslateClient:
+    """Translation client stand-in that records each call's contents."""
+
+    def __init__(self, translate=str.upper):
+        self.translate = translate
+        self.calls = []
+
+    def translate_text(self, parent, contents, source_language_code,
+                       target_language_code, mime_type):
+        self.calls.append(list(contents))
+        return SimpleNamespace(translations=[
+            SimpleNamespace(translated_text=self.translate(text)) for text in contents
+        ])
+
+
+def make_translator(client=None):
+    """Create a Translator without loading credentials."""
+    translator = Translator.__new__(Translator)
+    translator.client = client or FakeTranslateClient()
+    translator.parent = "projects/test/locations/global"
+    translator._cache = {}
+    return translator
+
+
+class TestGroupTexts:
+    """Test cases for joining texts into translate() values."""
+
+    def test_groups_up_to_limit(self):
+        """Test that texts are joined until the next one would exceed the limit."""
+        translator = make_translator()
+        translator.MAX_JOINED_CHARS = 4 + len(_SEGMENT_SEPARATOR) + 4
+
+        groups = translator._group_texts(["aaaa", "bbbb", "cccc"])
+
+        assert groups == [["aaaa", "bbbb"], ["cccc"]]
+
+    def test_one_over_limit_starts_new_group(self):
+        """Test that one character over the limit starts a new group."""
+        translator = make_translator()
+        translator.MAX_JOINED_CHARS = 4 + len(_SEGMENT_SEPARATOR) + 3
+
+        groups = translator._group_texts(["aaaa", "bbbb", "cccc"])
+
+        assert groups == [["aaaa"], ["bbbb"], ["cccc"]]
+
+    def test_long_text_gets_own_group(self):
+        """Test that a text longer than the limit is still sent, on its own."""
+        translator = make_translator()
+        translator.MAX_JOINED_CHARS = 10
+
+        groups = translator._group_texts(["a", "b" * 30, "c"])
+
+        assert groups == [["a"], ["b" * 30], ["c"]]
+
+    def test_empty_texts(self):
+        """Test that no texts give no groups."""
+        assert make_translator()._group_texts([]) == []
+
+
+class TestTranslateBatch:
+    """Test cases for joined translation and its fallback."""
+
+    def test_joined_translation_is_split_back(self):
+        """Test that a joined group is sent as one value and split back."""
+        client = FakeTranslateClient()
+        translator = make_translator(client)
+
+        result = translator._translate_batch_with_retry(["abc", "def", "ghi"], 'zh-CN')
+
+        assert result == ["ABC", "DEF", "GHI"]
+        assert client.calls == [[_SEGMENT_SEPARATOR.join(["abc", "def", "ghi"])]]
+
+    def test_mismatched_split_falls_back_to_items(self):
+        """Test retranslating item by item when the marker is lost."""
+        client = FakeTranslateClient(
+            lambda text: text.replace(_SEGMENT_MARKER, '').upper()
+        )
+        translator = make_translator(client)
+
+        result = translator._translate_batch_with_retry(["abc", "def", "ghi"], 'zh-CN')
+
+        assert result == ["ABC", "DEF", "GHI"]
+        assert client.calls == [
+            [_SEGMENT_SEPARATOR.join(["abc", "def", "ghi"])],
+            ["abc", "def", "ghi"],
+        ]
+
+    def test_fallback_only_for_mismatched_group(self):
+        """Test that groups that split correctly are not retranslated."""
+        client = FakeTranslateClient(
+            lambda text: text.upper() if "aaaa" in text else text.replace(_SEGMENT_MARKER, '')
+        )
+        translator = make_translator(client)
+        translator.MAX_JOINED_CHARS = 4 + len(_SEGMENT_SEPARATOR) + 4
+
+        result = translator._translate_batch_with_retry(
+            ["aaaa", "bbbb", "cccc", "dddd"], 'zh-CN'
+        )
+
+        assert result == ["AAAA", "BBBB", "cccc", "dddd"]
+        assert len(client.calls) == 3
+        assert client.calls[2] == ["cccc", "dddd"]
+
+
+class TestTranslationCache:
+    """Test cases for the translation cache, dedupe and pass-through."""
+
+    def _segments(self, texts):
+        return [TranscriptSegment(text, i * 2.0, i * 2.0 + 1.5) for i, text in enumerate(texts)]
+
+    def _sent(self, client):
+        """Texts sent to the API, with joined values split back apart."""
+        return [
+            text
+            for contents in client.calls
+            for value in contents
+            for text in value.split(_SEGMENT_SEPARATOR)
+        ]
+
+    def test_duplicate_texts_sent_once(self):
+        """Test that repeated texts are translated once and filled in everywhere."""
+        client = FakeTranslateClient()
+        translator = make_translator(client)
+        segments = self._segments(["hai", "iie", "hai", "hai"])
+
+        result = translator.translate_segments(segments)
+
+        assert [s.text for s in result] == ["HAI", "IIE", "HAI", "HAI"]
+        assert sorted(self._sent(client)) == ["hai", "iie"]
+
+    def test_cached_texts_not_resent(self):
+        """Test that a second call reuses earlier translations."""
+        client = FakeTranslateClient()
+        translator = make_translator(client)
+        long_text = "nagai" * 20  # Cached under a hashed key
+
+        translator.translate_segments(self._segments(["hai", long_text]))
+        client.calls.clear()
+        result = translator.translate_segments(self._segments([long_text, "hai", "new"]))
+
+        assert [s.text for s in result] == [long_text.upper(), "HAI", "NEW"]
+        assert self._sent(client) == ["new"]
+
+    def test_cache_is_per_target_language(self):
+        """Test that a translation is not reused for another target language."""
+        client = FakeTranslateClient()
+        translator = make_translator(client)
+
+        translator.translate_segments(self._segments(["hai"]), target_language='zh-CN')
+        translator.translate_segments(self._segments(["hai"]), target_language='zh-TW')
+
+        assert self._sent(client) == ["hai", "hai"]
+
+    def test_texts_without_letters_passed_through(self):
+        """Test that blank, numeric and punctuation-only texts skip the API."""
+        client = FakeTranslateClient()
+        translator = make_translator(client)
+        texts = ["", "１２３", "!?。", "…", "abc1"]
+
+        result = translator.translate_segments(self._segments(texts))
+
+        assert [s.text for s in result] == ["", "１２３", "!?。", "…", "ABC1"]
+        assert self._sent(client) == ["abc1"]
+
+    def test_timestamps_preserved(self):
+        """Test that translated segments keep their original timing."""
+        translator = make_translator()
+        segments = self._segments(["hai", "hai", "..."])
+
+        result = translator.translate_segments(segments)
+
+        assert [(s.start_time, s.end_time) for s in result] == [
+            (s.start_time, s.end_time) for s in segments
+        ]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
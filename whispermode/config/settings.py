@@ -42,7 +42,12 @@ class Settings:
         self.whisper_config = {
             'model_size': whisper_model or os.getenv('WHISPER_MODEL', 'medium'),
             'device': os.getenv('WHISPER_DEVICE', 'auto'),  # 'auto', 'cpu', or 'cuda'
-            'language': 'ja'  # Japanese
+            'language': 'ja',  # Japanese
+            'batch_size': int(os.getenv('WHISPER_BATCH_SIZE', '16')),  # Chunks decoded together
+            'compute_type': os.getenv('WHISPER_COMPUTE_TYPE'),  # None: int8_float16 on GPU, int8 on CPU
+            'cpu_threads': int(os.getenv('WHISPER_CPU_THREADS', '0')) or None,  # None: all cores
+            'num_workers': int(os.getenv('WHISPER_NUM_WORKERS', '1')),
+            'word_timestamps': True  # False: segment-level timing, no word alignment
         }
 
         # Translation settings
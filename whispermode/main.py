@@ -5,6 +5,7 @@ A CLI tool that generates Chinese subtitles using Whisper for transcription
 and Google Translate for translation. Much better quality than Google Speech-to-Text!
 """
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import click
 from loguru import logger
@@ -14,6 +15,7 @@ from src.audio_extractor import AudioExtractor
 from src.speech_recognizer import SpeechRecognizer
 from src.translator import Translator
 from src.subtitle_generator import SubtitleGenerator
+from src.pipeline import SubtitlePipeline
 from src.utils import (
     setup_logging,
     validate_video_file,
@@ -25,12 +27,12 @@ from src.utils import (
 
 
 @click.command()
-@click.argument('video_path', type=click.Path(exists=True))
+@click.argument('video_paths', nargs=-1, required=True, type=click.Path(exists=True))
 @click.option(
     '-o', '--output',
     'output_path',
     type=click.Path(),
-    help='Output SRT file path (default: <video_name>.srt)'
+    help='Output SRT file path, for a single video (default: the video path with .srt)'
 )
 @click.option(
     '-c', '--credentials',
@@ -50,10 +52,35 @@ from src.utils import (
     type=click.Choice(['auto', 'cpu', 'cuda']),
     help='Device to run Whisper on (auto detects GPU)'
 )
+@click.option(
+    '--compute-type',
+    type=click.Choice(['float16', 'int8_float16', 'int8', 'float32', 'bfloat16']),
+    help='Whisper compute type (default: int8_float16 on GPU, int8 on CPU)'
+)
+@click.option(
+    '--cpu-threads',
+    type=click.IntRange(min=1),
+    help='Threads for CPU decoding (default: all CPU cores)'
+)
+@click.option(
+    '--num-workers',
+    type=click.IntRange(min=1),
+    help='Whisper model workers for concurrent transcriptions (default: 1)'
+)
+@click.option(
+    '--batch-size',
+    type=click.IntRange(min=1),
+    help='Speech chunks Whisper decodes at once, lower it if the GPU runs out of memory (default: 16)'
+)
+@click.option(
+    '--segment-level-timing',
+    is_flag=True,
+    help='Use Whisper segment timing instead of aligning words (faster, coarser timing)'
+)
 @click.option(
     '--keep-temp',
     is_flag=True,
-    help='Keep temporary audio files after processing'
+    help='Write extracted audio to the temp directory and keep it after processing'
 )
 @click.option(
     '-v', '--verbose',
@@ -66,7 +93,8 @@ from src.utils import (
     type=click.Choice(['zh-CN', 'zh-TW']),
     help='Target Chinese variant: zh-CN (Simplified) or zh-TW (Traditional)'
 )
-def main(video_path, output_path, credentials_path, whisper_model, device,
+def main(video_paths, output_path, credentials_path, whisper_model, device,
+         compute_type, cpu_threads, num_workers, batch_size, segment_level_timing,
          keep_temp, verbose, target_lang):
     """
     Generate Chinese subtitles for Japanese movies using Whisper.
@@ -75,12 +103,31 @@ def main(video_path, output_path, credentials_path, whisper_model, device,
     Whisper provides MUCH better transcription quality than Google Speech-to-Text!
     No API costs for transcription, only for translation.
 
+    \b
+    Several videos can be given at once; the Whisper model is loaded only
+    once and reused for each of them, and the next video's audio is
+    extracted while the current one is transcribed.
+
     \b
     Example usage:
         python main.py movie.mp4
         python main.py movie.mp4 --whisper-model large-v3
         python main.py movie.mp4 --target-lang zh-TW --verbose
+        python main.py episode01.mp4 episode02.mp4 episode03.mp4
     """
+    if output_path and len(video_paths) > 1:
+        raise click.UsageError("--output can only be used with a single video")
+
+    # Videos that only differ in extension would write the same SRT file
+    srt_paths = {}
+    for video_path in video_paths:
+        srt_path = Path(video_path).with_suffix('.srt').resolve()
+        if srt_path in srt_paths:
+            raise click.UsageError(
+                f"{srt_paths[srt_path]} and {video_path} would both write {srt_path}"
+            )
+        srt_paths[srt_path] = video_path
+
     # Setup logging
     setup_logging(verbose)
 
@@ -96,87 +143,165 @@ def main(video_path, output_path, credentials_path, whisper_model, device,
         # Update configurations
         settings.translation_config['target_language'] = target_lang
         settings.whisper_config['device'] = device
+        if batch_size:
+            settings.whisper_config['batch_size'] = batch_size
+        if compute_type:
+            settings.whisper_config['compute_type'] = compute_type
+        if cpu_threads:
+            settings.whisper_config['cpu_threads'] = cpu_threads
+        if num_workers:
+            settings.whisper_config['num_workers'] = num_workers
+        if segment_level_timing:
+            settings.whisper_config['word_timestamps'] = False
+
+        logger.info(f"Whisper model: {whisper_model} on {device}")
+        logger.info(f"Target language: {target_lang}")
+
+        # Load the model and clients once for all videos
+        recognizer = SpeechRecognizer(
+            model_size=settings.whisper_config['model_size'],
+            device=settings.whisper_config['device'],
+            language=settings.whisper_config['language'],
+            batch_size=settings.whisper_config['batch_size'],
+            compute_type=settings.whisper_config['compute_type'],
+            cpu_threads=settings.whisper_config['cpu_threads'],
+            num_workers=settings.whisper_config['num_workers'],
+            word_timestamps=settings.whisper_config['word_timestamps']
+        )
+        translator = Translator(credentials_path=settings.credentials_path)
+
+    except SubtitleGeneratorError as e:
+        logger.error(f"Subtitle generation error: {e}")
+        return 1
+    except Exception as e:
+        logger.exception(f"Unexpected error: {e}")
+        return 1
+
+    failures = 0
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix='prefetch') as prefetcher:
+        next_audio = prefetcher.submit(_prepare_audio, video_paths[0], settings, keep_temp)
+        for i, video_path in enumerate(video_paths):
+            audio = next_audio
+            # Extract the next video's audio while this one is transcribed
+            if i + 1 < len(video_paths):
+                next_audio = prefetcher.submit(
+                    _prepare_audio, video_paths[i + 1], settings, keep_temp
+                )
+
+            if not _generate_subtitles(video_path, audio, output_path, settings,
+                                       recognizer, translator, target_lang,
+                                       whisper_model):
+                failures += 1
+
+    # Cleanup temporary files (audio is only written to disk with
+    # --keep-temp; this clears anything left by earlier runs)
+    if not keep_temp:
+        logger.info("Cleaning up temporary files...")
+        cleanup_temp_files(settings.temp_dir)
+
+    if len(video_paths) > 1:
+        logger.info(
+            f"Processed {len(video_paths)} videos: "
+            f"{len(video_paths) - failures} succeeded, {failures} failed"
+        )
+
+    return 1 if failures else 0
+
 
+def _prepare_audio(video_path, settings, keep_temp):
+    """
+    Validate a video and load its audio for transcription.
+
+    The audio is piped from ffmpeg into memory, unless keep_temp asks for
+    the WAV file to be written to the temp directory.
+
+    Returns:
+        tuple: (waveform, duration in seconds)
+    """
+    validate_video_file(video_path)
+
+    extractor = AudioExtractor(
+        sample_rate=settings.audio_config['sample_rate'],
+        channels=settings.audio_config['channels']
+    )
+    if keep_temp:
+        audio_path = extractor.extract_audio(video_path, settings.temp_dir)
+        waveform = extractor.load_waveform(audio_path)
+    else:
+        waveform = extractor.extract_waveform(video_path)
+
+    return waveform, len(waveform) / extractor.sample_rate
+
+
+def _generate_subtitles(video_path, audio, output_path, settings, recognizer,
+                        translator, target_lang, whisper_model):
+    """
+    Generate the subtitle file for one video.
+
+    Args:
+        audio: Future for the video's _prepare_audio result
+
+    Returns:
+        bool: True if the subtitle file was created
+    """
+    try:
         # Generate default output path if not provided
         if not output_path:
-            output_path = Path(video_path).stem + '.srt'
+            output_path = Path(video_path).with_suffix('.srt')
 
+        logger.info("-" * 60)
         logger.info(f"Input video: {video_path}")
         logger.info(f"Output subtitle: {output_path}")
-        logger.info(f"Whisper model: {whisper_model} on {device}")
-        logger.info(f"Target language: {target_lang}")
         logger.info("-" * 60)
 
-        # Step 1: Validate input video
-        logger.info("Step 1/5: Validating video file...")
-        validate_video_file(video_path)
-        logger.success("Video file validated")
-
-        # Step 2: Extract audio from video
-        logger.info("Step 2/5: Extracting audio from video...")
-        extractor = AudioExtractor(
-            sample_rate=settings.audio_config['sample_rate'],
-            channels=settings.audio_config['channels']
-        )
-        audio_path = extractor.extract_audio(video_path, settings.temp_dir)
-        duration = extractor.get_audio_duration(audio_path)
+        # Steps 1-2: Validate input video and extract audio (may already
+        # have run in the background while the previous video was processed)
+        logger.info("Steps 1-2/5: Validating video file and extracting audio...")
+        waveform, duration = audio.result()
         logger.success(f"Audio extracted: {format_duration(duration)}")
 
-        # Step 3: Transcribe Japanese audio with Whisper
-        logger.info("Step 3/5: Transcribing Japanese audio with Whisper...")
+        # Steps 3-5 run concurrently: Whisper keeps transcribing while
+        # earlier segments are translated and written
+        logger.info(
+            "Steps 3-5/5: Transcribing with Whisper, translating to Chinese "
+            "and writing subtitles..."
+        )
         logger.info("⚡ Whisper provides much better quality than Google Speech-to-Text!")
-        recognizer = SpeechRecognizer(
-            model_size=settings.whisper_config['model_size'],
-            device=settings.whisper_config['device'],
-            language=settings.whisper_config['language']
+        generator = SubtitleGenerator(
+            min_duration=settings.subtitle_config['min_segment_duration'],
+            max_chars=settings.subtitle_config['max_chars_per_segment']
         )
-        japanese_segments = recognizer.transcribe_audio(audio_path)
-        logger.success(f"Transcription complete: {len(japanese_segments)} segments")
 
-        # Step 4: Translate to Chinese
-        logger.info("Step 4/5: Translating Japanese to Chinese...")
-        translator = Translator(credentials_path=settings.credentials_path)
-        chinese_segments = translator.translate_segments(
-            japanese_segments,
+        pipeline = SubtitlePipeline(
+            recognizer,
+            translator,
+            generator,
             target_language=target_lang,
             batch_size=settings.translation_config['batch_size']
         )
-        logger.success(f"Translation complete: {len(chinese_segments)} segments")
-
-        # Step 5: Generate SRT subtitle file
-        logger.info("Step 5/5: Generating SRT subtitle file...")
-        generator = SubtitleGenerator(
-            min_duration=settings.subtitle_config['min_segment_duration'],
-            max_chars=settings.subtitle_config['max_chars_per_segment']
-        )
-        output_file = generator.generate_srt(chinese_segments, output_path)
+        output_file = pipeline.run(waveform, output_path)
         logger.success(f"Subtitle file created: {output_file}")
 
-        # Cleanup temporary files
-        if not keep_temp:
-            logger.info("Cleaning up temporary files...")
-            cleanup_temp_files(settings.temp_dir)
-
         # Success summary
         logger.info("=" * 60)
         logger.success("SUBTITLE GENERATION COMPLETE! 🎉")
         logger.info(f"Video duration: {format_duration(duration)}")
-        logger.info(f"Subtitle segments: {len(chinese_segments)}")
+        logger.info(f"Subtitle segments: {generator.subtitle_count}")
         logger.info(f"Whisper model: {whisper_model}")
         logger.info(f"Output file: {output_file}")
         logger.info("=" * 60)
 
-        return 0
+        return True
 
     except VideoFileError as e:
         logger.error(f"Video file error: {e}")
-        return 1
+        return False
     except SubtitleGeneratorError as e:
         logger.error(f"Subtitle generation error: {e}")
-        return 1
+        return False
     except Exception as e:
         logger.exception(f"Unexpected error: {e}")
-        return 1
+        return False
 
 
 if __name__ == '__main__':
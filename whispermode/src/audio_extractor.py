@@ -1,7 +1,11 @@
 """Audio extraction module using MoviePy."""
 import os
+import subprocess
+import uuid
+import wave
 from pathlib import Path
-from datetime import datetime
+import numpy as np
+from moviepy.config import get_setting
 from moviepy.editor import VideoFileClip
 from loguru import logger
 
@@ -41,9 +45,9 @@ class AudioExtractor:
             temp_dir = Path(temp_dir)
             temp_dir.mkdir(parents=True, exist_ok=True)
 
-            # Generate unique temp filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            audio_filename = f"audio_{timestamp}.wav"
+            # Generate unique temp filename (the next video may be extracted
+            # in the background while this one is transcribed)
+            audio_filename = f"audio_{uuid.uuid4().hex}.wav"
             audio_path = temp_dir / audio_filename
 
             logger.info(f"Loading video: {video_path}")
@@ -84,6 +88,100 @@ class AudioExtractor:
                 f"Failed to extract audio from {video_path}: {e}"
             )
 
+    def extract_waveform(self, video_path):
+        """
+        Decode the audio of a video straight into a float32 waveform.
+
+        ffmpeg writes raw samples to a pipe, so no temporary WAV file is
+        written to disk and read back.
+
+        Args:
+            video_path: Path to input video file
+
+        Returns:
+            numpy.ndarray: Mono float32 samples at self.sample_rate
+
+        Raises:
+            AudioExtractionError: If extraction fails
+        """
+        logger.info(
+            f"Extracting audio from {video_path} "
+            f"(sample_rate={self.sample_rate}Hz, mono)..."
+        )
+
+        command = [
+            get_setting('FFMPEG_BINARY'),  # Same ffmpeg MoviePy uses
+            '-nostdin',
+            '-loglevel', 'error',
+            '-i', str(video_path),
+            '-vn',
+            '-f', 'f32le',
+            '-ac', '1',  # Whisper takes mono audio
+            '-ar', str(self.sample_rate),
+            'pipe:1'
+        ]
+
+        try:
+            result = subprocess.run(command, capture_output=True)
+        except Exception as e:
+            raise AudioExtractionError(
+                f"Failed to extract audio from {video_path}: {e}"
+            )
+
+        if result.returncode != 0:
+            error = result.stderr.decode('utf-8', errors='replace').strip()
+            raise AudioExtractionError(
+                f"Failed to extract audio from {video_path}: {error}"
+            )
+
+        if not result.stdout:
+            raise AudioExtractionError(
+                f"Video has no audio track: {video_path}"
+            )
+
+        waveform = np.frombuffer(result.stdout, dtype=np.float32)
+        logger.success(f"Audio extracted: {len(waveform)} samples")
+        return waveform
+
+    def load_waveform(self, audio_path):
+        """
+        Load an extracted WAV file as a float32 waveform.
+
+        Whisper accepts the samples directly instead of decoding the file
+        again with ffmpeg.
+
+        Args:
+            audio_path: Path to a 16-bit PCM WAV file from extract_audio
+
+        Returns:
+            numpy.ndarray: Mono float32 samples in [-1, 1) at self.sample_rate
+
+        Raises:
+            AudioExtractionError: If the file can't be read
+        """
+        try:
+            with wave.open(str(audio_path), 'rb') as wav:
+                if wav.getsampwidth() != 2 or wav.getframerate() != self.sample_rate:
+                    raise AudioExtractionError(
+                        f"Expected 16-bit {self.sample_rate}Hz audio: {audio_path}"
+                    )
+                channels = wav.getnchannels()
+                frames = wav.readframes(wav.getnframes())
+
+            waveform = np.frombuffer(frames, dtype=np.int16).astype(np.float32)
+            waveform /= 32768.0
+            if channels > 1:
+                waveform = waveform.reshape(-1, channels).mean(axis=1)
+
+            return waveform
+
+        except AudioExtractionError:
+            raise
+        except Exception as e:
+            raise AudioExtractionError(
+                f"Failed to load audio from {audio_path}: {e}"
+            )
+
     def get_audio_duration(self, audio_path):
         """
         Get duration of audio file in seconds.
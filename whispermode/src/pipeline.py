@@ -0,0 +1,156 @@
+"""Pipelined transcription, translation and SRT writing."""
+import queue
+import threading
+from loguru import logger
+
+# Marks the end of a stage's output
+_DONE = object()
+
+# Segments allowed to wait between two stages; a fast stage blocks instead of
+# running far ahead of a slow one
+_QUEUE_SIZE = 512
+
+
+class SubtitlePipeline:
+    """
+    Transcribe, translate and write subtitles concurrently.
+
+    Each stage runs in its own thread and hands segments to the next stage
+    through a queue, so Whisper keeps the GPU busy while earlier segments
+    wait on the Translate API and get written to disk.
+    """
+
+    def __init__(self, recognizer, translator, generator,
+                 target_language='zh-CN', batch_size=128):
+        """
+        Initialize subtitle pipeline.
+
+        Args:
+            recognizer: SpeechRecognizer used to transcribe the audio
+            translator: Translator used to translate the segments
+            generator: SubtitleGenerator used to write the SRT file
+            target_language: Target language code for translation
+            batch_size: Number of segments to translate per API call
+        """
+        self.recognizer = recognizer
+        self.translator = translator
+        self.generator = generator
+        self.target_language = target_language
+        self.batch_size = batch_size
+
+        self._error = None
+
+    def run(self, audio, output_path):
+        """
+        Generate a translated SRT file for an audio file.
+
+        Args:
+            audio: Path to audio file or waveform, as accepted by
+                   SpeechRecognizer.transcribe_audio
+            output_path: Path to output SRT file
+
+        Returns:
+            str: Path to generated SRT file
+
+        Raises:
+            SubtitleGeneratorError: The first error raised by any stage
+        """
+        self._error = None
+        text_queue = queue.Queue(maxsize=_QUEUE_SIZE)
+        translation_queue = queue.Queue(maxsize=_QUEUE_SIZE)
+        result = {}
+
+        threads = [
+            threading.Thread(
+                target=self._transcribe_stage,
+                args=(audio, text_queue),
+                name='pipeline-transcribe'
+            ),
+            threading.Thread(
+                target=self._translate_stage,
+                args=(text_queue, translation_queue),
+                name='pipeline-translate'
+            ),
+            threading.Thread(
+                target=self._write_stage,
+                args=(translation_queue, output_path, result),
+                name='pipeline-write'
+            ),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if self._error is not None:
+            raise self._error
+
+        return result['output_file']
+
+    def _transcribe_stage(self, audio, text_queue):
+        """Transcribe the audio and pass each segment to the translate stage."""
+        try:
+            for segment in self.recognizer.transcribe_audio(audio):
+                if self._error is not None:
+                    break
+                text_queue.put(segment)
+        except Exception as e:
+            self._fail(e)
+        finally:
+            text_queue.put(_DONE)
+
+    def _translate_stage(self, text_queue, translation_queue):
+        """Translate segments in batches and pass them to the write stage."""
+        try:
+            for segment in self.translator.translate_segments(
+                self._iter_queue(text_queue),
+                target_language=self.target_language,
+                batch_size=self.batch_size
+            ):
+                translation_queue.put(segment)
+        except Exception as e:
+            self._fail(e)
+            # Drain so the transcribe stage is never left blocked
+            self._drain(text_queue)
+        finally:
+            translation_queue.put(_DONE)
+
+    def _write_stage(self, translation_queue, output_path, result):
+        """Merge and write translated segments to the SRT file."""
+        try:
+            result['output_file'] = self.generator.generate_srt(
+                self._iter_queue(translation_queue),
+                output_path
+            )
+        except Exception as e:
+            self._fail(e)
+            self._drain(translation_queue)
+
+    def _iter_queue(self, source_queue):
+        """
+        Yield items from a queue until the previous stage is done.
+
+        Raises:
+            Exception: The pipeline's error, if an earlier stage stopped
+                because of a failure, so its partial output is never taken
+                as complete (e.g. written out as a finished SRT file)
+        """
+        while (item := source_queue.get()) is not _DONE:
+            yield item
+        # Put the marker back so draining after a failure ends right away
+        source_queue.put(_DONE)
+
+        if self._error is not None:
+            raise self._error
+
+    def _drain(self, source_queue):
+        """Discard items from a queue until the previous stage is done."""
+        while source_queue.get() is not _DONE:
+            pass
+        source_queue.put(_DONE)
+
+    def _fail(self, error):
+        """Record the first error so the other stages stop early."""
+        if self._error is None:
+            logger.debug(f"Pipeline stage failed: {error}")
+            self._error = error
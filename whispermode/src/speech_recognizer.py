@@ -1,16 +1,43 @@
 """Speech recognition module using Whisper (faster-whisper)."""
+import functools
+import os
 from pathlib import Path
-from faster_whisper import WhisperModel
 from loguru import logger
 
 from .subtitle_generator import TranscriptSegment
 from .utils import TranscriptionError
 
+# Punctuation marks that indicate end of sentence (Japanese and ASCII)
+_SENTENCE_ENDINGS = frozenset('。！？、.!?…')
+
+# Closing quotes/brackets that may follow the sentence ending, as in 「…。」
+_CLOSING_BRACKETS_STR = '」』）)]'
+_CLOSING_BRACKETS = frozenset(_CLOSING_BRACKETS_STR)
+
+
+@functools.lru_cache(maxsize=2)
+def _load_model(model_size, device, compute_type, cpu_threads, num_workers):
+    """Load a Whisper model once per configuration and reuse it."""
+    # Imported here: faster-whisper loads CTranslate2 and the VAD model,
+    # which would slow down CLI startup (e.g. --help) for nothing
+    from faster_whisper import WhisperModel
+
+    return WhisperModel(
+        model_size,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,  # 0 keeps the CTranslate2 default
+        num_workers=num_workers,
+        download_root=None  # Uses default cache directory
+    )
+
 
 class SpeechRecognizer:
     """Transcribe audio to text using Whisper (OpenAI's speech recognition model)."""
 
-    def __init__(self, model_size='medium', device='auto', language='ja'):
+    def __init__(self, model_size='medium', device='auto', language='ja', batch_size=16,
+                 compute_type=None, cpu_threads=None, num_workers=1,
+                 word_timestamps=True):
         """
         Initialize Whisper speech recognizer.
 
@@ -19,44 +46,60 @@ class SpeechRecognizer:
                        Recommended for Japanese: 'medium' (good balance) or 'large-v3' (best quality)
             device: Device to run on - 'auto', 'cpu', 'cuda' (auto detects GPU if available)
             language: Language code for transcription (default: 'ja' for Japanese)
+            batch_size: Number of speech chunks decoded together (lower it if
+                       the GPU runs out of memory)
+            compute_type: CTranslate2 compute type, e.g. 'int8_float16', 'float16'
+                       (default: 'int8_float16' on CUDA, 'int8' on CPU)
+            cpu_threads: Threads used for CPU decoding (default: all CPU cores)
+            num_workers: Model workers, so that many transcriptions can run
+                       at once from different threads
+            word_timestamps: Align each word to split subtitles at word
+                       boundaries; False uses Whisper's segment timing and
+                       skips the alignment pass
         """
         self.model_size = model_size
         self.language = language
+        self.batch_size = batch_size
+        self.word_timestamps = word_timestamps
 
         try:
             logger.info(f"Loading Whisper model: {model_size}")
             logger.info("This may take a few minutes on first run (downloading model)...")
 
-            # Determine compute type based on device
+            # Determine device
             if device == 'auto':
                 # Try CUDA first, fall back to CPU
                 try:
                     import torch
                     if torch.cuda.is_available():
                         device = 'cuda'
-                        compute_type = 'float16'
                         logger.info("GPU detected! Using CUDA for faster processing")
                     else:
                         device = 'cpu'
-                        compute_type = 'int8'
                         logger.info("No GPU detected, using CPU")
                 except ImportError:
                     device = 'cpu'
-                    compute_type = 'int8'
                     logger.info("PyTorch not found, using CPU")
-            elif device == 'cuda':
-                compute_type = 'float16'
-            else:
-                compute_type = 'int8'
-
-            # Initialize Whisper model
-            self.model = WhisperModel(
-                model_size,
-                device=device,
-                compute_type=compute_type,
-                download_root=None  # Uses default cache directory
+
+            # Default compute type based on device: int8 weights (half the
+            # VRAM and decoder bandwidth), computed in fp16 on GPU
+            if compute_type is None:
+                compute_type = 'int8_float16' if device == 'cuda' else 'int8'
+
+            # CTranslate2 only uses 4 threads by default, leaving cores idle
+            if cpu_threads is None:
+                cpu_threads = (os.cpu_count() or 4) if device == 'cpu' else 0
+
+            # Initialize Whisper model (shared by recognizers with the same settings)
+            self.model = _load_model(
+                model_size, device, compute_type, cpu_threads, num_workers
             )
 
+            # Batched pipeline: splits audio into speech chunks with VAD and
+            # decodes batches of chunks at once instead of one 30s window at a time
+            from faster_whisper import BatchedInferencePipeline
+            self.batched = BatchedInferencePipeline(model=self.model)
+
             logger.success(
                 f"Whisper model loaded: {model_size} on {device} "
                 f"(compute_type: {compute_type})"
@@ -67,29 +110,45 @@ class SpeechRecognizer:
                 f"Failed to initialize Whisper model '{model_size}': {e}"
             )
 
-    def transcribe_audio(self, audio_path):
+    def transcribe_audio(self, audio):
         """
         Transcribe audio file to text with timestamps using Whisper.
 
+        Segments are yielded as Whisper decodes them, so translation and
+        subtitle writing can start before the whole file is transcribed.
+
         Args:
-            audio_path: Path to audio file (WAV format recommended)
+            audio: Path to audio file (WAV format recommended), or a 16kHz
+                   mono float32 waveform from AudioExtractor.load_waveform
 
-        Returns:
-            List[TranscriptSegment]: Transcribed segments with timestamps
+        Yields:
+            TranscriptSegment: Transcribed segments with timestamps, in order
 
         Raises:
             TranscriptionError: If transcription fails
         """
         try:
-            logger.info(f"Transcribing audio with Whisper: {audio_path}")
+            if isinstance(audio, (str, Path)):
+                logger.info(f"Transcribing audio with Whisper: {audio}")
+            else:
+                logger.info(f"Transcribing {len(audio)} samples with Whisper")
 
             # Transcribe with Whisper
-            # word_timestamps=True gives us word-level timing for better subtitle sync
-            segments_generator, info = self.model.transcribe(
-                audio_path,
+            # word_timestamps=True gives us word-level timing for better subtitle sync,
+            # at the cost of an extra alignment pass per segment.
+            # The batched pipeline decodes every chunk without conditioning on
+            # the previous text (condition_on_previous_text=False is fixed),
+            # which is what lets chunks run in parallel
+            segments_generator, info = self.batched.transcribe(
+                audio,
                 language=self.language,
+                batch_size=self.batch_size,
                 beam_size=5,  # Higher beam size = better quality, slower
-                word_timestamps=True,  # Enable word-level timestamps
+                word_timestamps=self.word_timestamps,
+                # Without word timing, Whisper's timestamp tokens are what
+                # split a merged VAD chunk (up to 30s) into subtitle-sized
+                # segments; the batched pipeline leaves them off by default
+                without_timestamps=self.word_timestamps,
                 vad_filter=True,  # Voice Activity Detection to remove silence
                 vad_parameters=dict(
                     min_silence_duration_ms=500  # Minimum silence duration
@@ -101,41 +160,38 @@ class SpeechRecognizer:
                 f"(probability: {info.language_probability:.2%})"
             )
 
-            # CRITICAL FIX: Convert generator to list immediately!
-            # faster-whisper returns a generator that can only be iterated once
-            logger.info("Converting Whisper segments to list...")
-            segments = list(segments_generator)
-            logger.info(f"Whisper found {len(segments)} raw segments covering full audio")
-
-            # Process segments into our format
-            transcript_segments = []
+            # faster-whisper returns a generator that can only be iterated
+            # once; consume it as it decodes instead of collecting a list
+            raw_count = 0
+            word_timed_count = 0
+            segment_count = 0
 
-            for i, segment in enumerate(segments):
-                if (i + 1) % 20 == 0:
-                    logger.debug(f"Processing segment {i+1}/{len(segments)}...")
+            for segment in segments_generator:
+                raw_count += 1
+                if raw_count % 20 == 0:
+                    logger.debug(f"Processing segment {raw_count}...")
                 # Create segment with word-level detail if available
                 if segment.words:
+                    word_timed_count += 1
                     # Group words into subtitle-friendly segments
-                    word_segments = self._create_segments_from_words(segment.words)
-                    transcript_segments.extend(word_segments)
+                    for word_segment in self._create_segments_from_words(segment.words):
+                        segment_count += 1
+                        yield word_segment
                 else:
                     # Fall back to segment-level timing
-                    transcript_segments.append(
-                        TranscriptSegment(
-                            text=segment.text.strip(),
-                            start_time=segment.start,
-                            end_time=segment.end,
-                            confidence=1.0  # Whisper doesn't provide confidence scores
-                        )
+                    segment_count += 1
+                    yield TranscriptSegment(
+                        text=segment.text.strip(),
+                        start_time=segment.start,
+                        end_time=segment.end,
+                        confidence=1.0  # Whisper doesn't provide confidence scores
                     )
 
             logger.success(
-                f"Transcription complete: {len(transcript_segments)} segments "
-                f"({sum(1 for s in segments if s.words)} with word timing)"
+                f"Transcription complete: {segment_count} segments from "
+                f"{raw_count} Whisper segments ({word_timed_count} with word timing)"
             )
 
-            return transcript_segments
-
         except TranscriptionError:
             raise
         except Exception as e:
@@ -161,38 +217,69 @@ class SpeechRecognizer:
         current_start = None
         current_end = None
 
-        # Japanese punctuation marks that indicate end of sentence
-        sentence_endings = {'。', '！', '？', '、'}
+        # Length and last character of the stripped segment text, tracked
+        # per word instead of joining the words on every iteration
+        text_len = 0  # Text length without leading whitespace
+        trailing_ws = 0  # Trailing whitespace included in text_len
+        last_char = ''  # Last non-whitespace character
+        prev_char = ''  # Character just before it ('' at the start, ' ' if whitespace)
 
         for word in words:
+            # Read the word text once instead of on every use below
+            word_text = word.word
+
             if current_start is None:
+                # A closing bracket right after a finalized sentence, as in
+                # 「…。」 split into two words, belongs to that sentence
+                closing = word_text.rstrip()
+                if (closing and segments and not closing.strip(_CLOSING_BRACKETS_STR)
+                        and segments[-1].text[-1:] in _SENTENCE_ENDINGS):
+                    segments[-1].text += closing
+                    segments[-1].end_time = word.end
+                    continue
+
                 current_start = word.start
 
-            current_words.append(word.word)
+            current_words.append(word_text)
             current_end = word.end
 
+            token = word_text if text_len else word_text.lstrip()
+            if token:
+                text_len += len(token)
+                content = token.rstrip()
+                if content:
+                    if len(content) > 1:
+                        prev_char = content[-2]
+                    else:
+                        prev_char = ' ' if trailing_ws else last_char
+                    trailing_ws = len(token) - len(content)
+                    last_char = content[-1]
+                else:
+                    trailing_ws += len(token)
+
             # Calculate current segment stats
             duration = current_end - current_start
-            text = ''.join(current_words).strip()
-
-            # Determine if we should finalize this segment
-            should_finalize = False
-
-            # Check various conditions for segment finalization
-            if duration >= max_duration:
-                should_finalize = True
-            elif len(text) >= max_chars:
-                should_finalize = True
-            elif any(text.endswith(punct) for punct in sentence_endings):
-                # End on sentence punctuation if we have reasonable length
-                if len(text) > 10 or duration > 1.0:
-                    should_finalize = True
-
-            if should_finalize:
+            char_count = text_len - trailing_ws
+
+            # Finalize when the segment is too long, or ends on sentence
+            # punctuation and has a reasonable length; the punctuation
+            # lookups only run once the cheap length checks pass
+            if (
+                duration >= max_duration
+                or char_count >= max_chars
+                or (
+                    (char_count > 10 or duration > 1.0)
+                    and (
+                        last_char in _SENTENCE_ENDINGS
+                        or (last_char in _CLOSING_BRACKETS
+                            and prev_char in _SENTENCE_ENDINGS)
+                    )
+                )
+            ):
                 # Create segment
                 segments.append(
                     TranscriptSegment(
-                        text=text,
+                        text=''.join(current_words).strip(),
                         start_time=current_start,
                         end_time=current_end,
                         confidence=1.0
@@ -203,6 +290,10 @@ class SpeechRecognizer:
                 current_words = []
                 current_start = None
                 current_end = None
+                text_len = 0
+                trailing_ws = 0
+                last_char = ''
+                prev_char = ''
 
         # Handle remaining words
         if current_words:
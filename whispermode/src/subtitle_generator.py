@@ -1,11 +1,16 @@
 """Subtitle generation module for creating SRT files."""
+import os
+import uuid
 from pathlib import Path
 from dataclasses import dataclass
 from typing import List
 from loguru import logger
 
+# Zero-padded two-digit strings for timestamp fields
+_PAD2 = [f"{i:02d}" for i in range(100)]
 
-@dataclass
+
+@dataclass(slots=True)
 class TranscriptSegment:
     """Represents a subtitle segment with text and timing information."""
     text: str
@@ -17,6 +22,9 @@ class TranscriptSegment:
 class SubtitleGenerator:
     """Generate SRT subtitle files from transcript segments."""
 
+    # Subtitles buffered before each write to the SRT file
+    WRITE_BATCH_SIZE = 64
+
     def __init__(self, min_duration=1.0, max_chars=80):
         """
         Initialize subtitle generator.
@@ -28,44 +36,72 @@ class SubtitleGenerator:
         self.min_duration = min_duration
         self.max_chars = max_chars
 
+        # Number of subtitles written by the last generate_srt call
+        self.subtitle_count = 0
+
     def generate_srt(self, segments, output_path):
         """
         Generate SRT subtitle file from transcript segments.
 
+        Segments are merged and written in a single pass as they arrive, so
+        an iterator from the transcription/translation steps is never held
+        in memory as a whole. They are written to a temporary file that
+        replaces output_path only once every segment is written, so a failed
+        run never leaves a truncated SRT or overwrites an earlier one.
+
         Args:
-            segments: List of TranscriptSegment objects
+            segments: Iterable of TranscriptSegment objects
             output_path: Path to output SRT file
 
         Returns:
             str: Path to generated SRT file
         """
-        logger.info(f"Generating SRT file with {len(segments)} segments...")
-
-        # Merge short segments for better readability
-        merged_segments = self._merge_short_segments(segments)
+        logger.info("Generating SRT file...")
 
         # Write SRT file
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            for i, segment in enumerate(merged_segments, start=1):
-                # Subtitle index
-                f.write(f"{i}\n")
+        self.subtitle_count = 0
+        # Same directory as the output, so os.replace is an atomic rename
+        temp_path = output_path.with_name(f".{output_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            self._write_blocks(segments, temp_path)
+            os.replace(temp_path, output_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        logger.success(f"SRT file generated: {output_path} ({self.subtitle_count} subtitles)")
+        return str(output_path)
+
+    def _write_blocks(self, segments, path):
+        """
+        Merge segments and write them as SRT blocks.
 
-                # Timestamp range
+        Args:
+            segments: Iterable of TranscriptSegment objects
+            path: Path of the file to write
+        """
+        # Binary mode: each batch is encoded to UTF-8 in one call and written
+        # as is, without the text layer (subtitles always use '\n' line ends)
+        with open(path, 'wb') as f:
+            blocks = []
+
+            # Merge short segments for better readability
+            for i, segment in enumerate(self._iter_merged_segments(segments), start=1):
+                # Index, timestamp range, text and blank line separator
                 start_ts = self._format_timestamp(segment.start_time)
                 end_ts = self._format_timestamp(segment.end_time)
-                f.write(f"{start_ts} --> {end_ts}\n")
+                blocks.append(f"{i}\n{start_ts} --> {end_ts}\n{segment.text}\n\n")
+                self.subtitle_count = i
 
-                # Subtitle text
-                f.write(f"{segment.text}\n")
+                # Write in batches rather than per line
+                if len(blocks) >= self.WRITE_BATCH_SIZE:
+                    f.write(''.join(blocks).encode('utf-8'))
+                    blocks.clear()
 
-                # Blank line separator
-                f.write("\n")
-
-        logger.success(f"SRT file generated: {output_path}")
-        return str(output_path)
+            f.write(''.join(blocks).encode('utf-8'))
 
     def _format_timestamp(self, seconds):
         """
@@ -77,12 +113,13 @@ class SubtitleGenerator:
         Returns:
             str: Formatted timestamp (e.g., "00:01:05,500")
         """
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millisecs = int((seconds % 1) * 1000)
+        # Integer milliseconds, so the fields can't disagree on rounding
+        secs, millisecs = divmod(round(seconds * 1000), 1000)
+        minutes, secs = divmod(secs, 60)
+        hours, minutes = divmod(minutes, 60)
 
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millisecs:03d}"
+        hours_str = _PAD2[hours] if hours < 100 else str(hours)
+        return f"{hours_str}:{_PAD2[minutes]}:{_PAD2[secs]},{millisecs:03d}"
 
     def _merge_short_segments(self, segments):
         """
@@ -94,51 +131,63 @@ class SubtitleGenerator:
         Returns:
             List[TranscriptSegment]: Merged segments
         """
-        if not segments:
-            return []
+        merged = list(self._iter_merged_segments(segments))
+        logger.debug(f"Merged {len(segments)} segments into {len(merged)} segments")
+        return merged
+
+    def _iter_merged_segments(self, segments):
+        """
+        Merge segments that are too short for readability, lazily.
+
+        Segments are merged in place: the first segment of each group is
+        extended and yielded instead of being copied.
+
+        Args:
+            segments: Iterable of TranscriptSegment objects
+
+        Yields:
+            TranscriptSegment: Merged segments
+        """
+        min_duration = self.min_duration
+        max_chars = self.max_chars
 
-        merged = []
         current = None
+        parts = []  # Texts merged into current, joined once it's finalized
+        text_len = 0  # Length of the joined text
 
         for segment in segments:
             if current is None:
-                current = TranscriptSegment(
-                    text=segment.text,
-                    start_time=segment.start_time,
-                    end_time=segment.end_time,
-                    confidence=segment.confidence
-                )
+                current = segment
+                parts = [segment.text]
+                text_len = len(segment.text)
                 continue
 
             duration = current.end_time - current.start_time
-            combined_text = current.text + " " + segment.text
+            combined_len = text_len + 1 + len(segment.text)
 
             # Check if we should merge with current segment
             should_merge = (
-                duration < self.min_duration or  # Current too short
+                duration < min_duration or  # Current too short
                 (
-                    len(combined_text) <= self.max_chars and  # Won't exceed max chars
+                    combined_len <= max_chars and  # Won't exceed max chars
                     segment.start_time - current.end_time < 1.0  # Close timing
                 )
             )
 
             if should_merge:
                 # Merge with current segment
-                current.text = combined_text
+                parts.append(segment.text)
+                text_len = combined_len
                 current.end_time = segment.end_time
             else:
                 # Finalize current segment and start new one
-                merged.append(current)
-                current = TranscriptSegment(
-                    text=segment.text,
-                    start_time=segment.start_time,
-                    end_time=segment.end_time,
-                    confidence=segment.confidence
-                )
+                current.text = ' '.join(parts)
+                yield current
+                current = segment
+                parts = [segment.text]
+                text_len = len(segment.text)
 
         # Add the last segment
         if current is not None:
-            merged.append(current)
-
-        logger.debug(f"Merged {len(segments)} segments into {len(merged)} segments")
-        return merged
+            current.text = ' '.join(parts)
+            yield current
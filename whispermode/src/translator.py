@@ -33,54 +33,77 @@ class Translator:
         """
         Translate transcript segments from Japanese to target language.
 
+        Segments are consumed and yielded lazily: only one batch is held at
+        a time, so translation can run while segments are still arriving.
+
         Args:
-            segments: List of TranscriptSegment objects with Japanese text
+            segments: Iterable of TranscriptSegment objects with Japanese text
             target_language: Target language code (default: zh-CN for Simplified Chinese)
             batch_size: Number of segments to translate per API call
 
-        Returns:
-            List[TranscriptSegment]: New segments with translated text, same timestamps
+        Yields:
+            TranscriptSegment: New segments with translated text, same timestamps
 
         Raises:
             TranslationError: If translation fails
         """
-        if not segments:
-            return []
-
-        logger.info(f"Translating {len(segments)} segments to {target_language}...")
+        logger.info(f"Translating segments to {target_language}...")
 
-        translated_segments = []
+        batch = []
+        batch_num = 0
+        translated_count = 0
 
         # Process in batches for efficiency
-        for i in range(0, len(segments), batch_size):
-            batch = segments[i:i + batch_size]
-            batch_num = i // batch_size + 1
-            total_batches = (len(segments) + batch_size - 1) // batch_size
+        for segment in segments:
+            batch.append(segment)
+            if len(batch) < batch_size:
+                continue
 
-            logger.info(f"Translating batch {batch_num}/{total_batches}...")
+            batch_num += 1
+            yield from self._translate_batch(batch, batch_num, target_language)
+            translated_count += len(batch)
+            batch = []
 
-            # Extract texts from segments
-            texts = [seg.text for seg in batch]
+        if batch:
+            batch_num += 1
+            yield from self._translate_batch(batch, batch_num, target_language)
+            translated_count += len(batch)
 
-            # Translate batch with retry logic
-            translated_texts = self._translate_batch_with_retry(
-                texts,
-                target_language=target_language
-            )
+        logger.success(f"Translation complete: {translated_count} segments")
 
-            # Create new segments with translated text but original timestamps
-            for segment, translated_text in zip(batch, translated_texts):
-                translated_segments.append(
-                    TranscriptSegment(
-                        text=translated_text,
-                        start_time=segment.start_time,
-                        end_time=segment.end_time,
-                        confidence=segment.confidence
-                    )
-                )
+    def _translate_batch(self, batch, batch_num, target_language):
+        """
+        Translate one batch of segments.
 
-        logger.success(f"Translation complete: {len(translated_segments)} segments")
-        return translated_segments
+        Args:
+            batch: List of TranscriptSegment objects with Japanese text
+            batch_num: Batch number, for progress logging
+            target_language: Target language code
+
+        Returns:
+            List[TranscriptSegment]: New segments with translated text, same timestamps
+        """
+        logger.info(f"Translating batch {batch_num} ({len(batch)} segments)...")
+
+        # Extract texts from segments
+        texts = [seg.text for seg in batch]
+
+        # Translate batch with retry logic
+        translated_texts = self._translate_batch_with_retry(
+            texts,
+            target_language=target_language
+        )
+
+        # Create new segments with translated text but original timestamps
+        return [
+            TranscriptSegment(
+                text=translated_text,
+                start_time=segment.start_time,
+                end_time=segment.end_time,
+                confidence=segment.confidence
+            )
+            for segment, translated_text in zip(batch, translated_texts)
+        ]
 
     def _translate_batch_with_retry(self, texts, target_language, max_retries=3):
         """
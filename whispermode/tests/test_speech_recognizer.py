@@ -0,0 +1,73 @@
+"""Tests for speech recognizer word grouping."""
+import pytest
+from collections import namedtuple
+
+from src.speech_recognizer import SpeechRecognizer
+
+# Same fields as faster-whisper's Word
+Word = namedtuple('Word', ['word', 'start', 'end'])
+
+
+def _words(tokens, step=0.3):
+    """Build consecutive words, each lasting step seconds."""
+    return [Word(token, i * step, (i + 1) * step) for i, token in enumerate(tokens)]
+
+
+def _group(words):
+    """Group words without loading a Whisper model."""
+    recognizer = SpeechRecognizer.__new__(SpeechRecognizer)
+    return [segment.text for segment in recognizer._create_segments_from_words(words)]
+
+
+class TestCreateSegmentsFromWords:
+    """Test cases for SpeechRecognizer._create_segments_from_words."""
+
+    def test_empty_words(self):
+        """Test that no words give no segments."""
+        assert _group([]) == []
+
+    def test_japanese_sentence_ending(self):
+        """Test splitting after Japanese sentence punctuation."""
+        words = _words(["今日は", "とても", "いい", "天気", "です", "ね。", "明日も", "晴れ"])
+        assert _group(words) == ["今日はとてもいい天気ですね。", "明日も晴れ"]
+
+    @pytest.mark.parametrize('ending', ['.', '!', '?', '…'])
+    def test_ascii_sentence_endings(self, ending):
+        """Test splitting after ASCII punctuation and the ellipsis."""
+        words = _words([" This", " is", " a", " long", f" sentence{ending}", " Next", " one"])
+        assert _group(words) == [f"This is a long sentence{ending}", "Next one"]
+
+    @pytest.mark.parametrize('closing', ['」', '』', '）', ')', ']'])
+    def test_closing_bracket_after_sentence_ending(self, closing):
+        """Test splitting after a closing bracket that follows a sentence end."""
+        words = _words(["「今日は", "とても", "いい", "天気", "です", "ね。", closing, "明日も"])
+        assert _group(words) == [f"「今日はとてもいい天気ですね。{closing}", "明日も"]
+
+    def test_closing_bracket_in_same_word(self):
+        """Test a sentence end and closing bracket within one word."""
+        words = _words(["「今日は", "とても", "いい", "天気", "です", "ね。」", "明日も"])
+        assert _group(words) == ["「今日はとてもいい天気ですね。」", "明日も"]
+
+    def test_closing_bracket_without_sentence_ending(self):
+        """Test that a closing bracket alone does not end a segment."""
+        words = _words(["「今日は", "とても", "いい", "天気", "です", "ね」", "明日も"])
+        assert _group(words) == ["「今日はとてもいい天気ですね」明日も"]
+
+    def test_closing_bracket_after_whitespace(self):
+        """Test that whitespace between the ending and bracket breaks the pair."""
+        words = _words([" This", " is", " a", " long", " sentence.", " )", " next"])
+        assert _group(words) == ["This is a long sentence.", ") next"]
+
+    def test_closing_bracket_after_empty_segment(self):
+        """Test a closing bracket after a whitespace-only segment."""
+        words = [Word(" ", 0.0, 6.0), Word("」", 6.0, 6.3)]
+        assert _group(words)[-1] == "」"
+
+    def test_short_sentence_not_split(self):
+        """Test that short, quick sentences stay with the following words."""
+        words = _words(["Hi.", " Yes", " indeed"], step=0.1)
+        assert _group(words) == ["Hi. Yes indeed"]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
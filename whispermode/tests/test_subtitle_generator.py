@@ -41,6 +41,12 @@ class TestSubtitleGenerator:
         assert generator._format_timestamp(3661.5) == "01:01:01,500"
         assert generator._format_timestamp(7322.25) == "02:02:02,250"
 
+    def test_format_timestamp_rounding(self):
+        """Test milliseconds rounding up into the next second."""
+        generator = SubtitleGenerator()
+        assert generator._format_timestamp(59.9996) == "00:01:00,000"
+        assert generator._format_timestamp(3599.9999) == "01:00:00,000"
+
     def test_merge_short_segments(self):
         """Test merging of short segments."""
         generator = SubtitleGenerator(min_duration=2.0)
@@ -107,6 +113,25 @@ class TestSubtitleGenerator:
             # Cleanup
             Path(temp_path).unlink(missing_ok=True)
 
+    def test_generate_srt_failure_keeps_existing_file(self):
+        """Test that a failing segment source leaves the previous SRT intact."""
+        generator = SubtitleGenerator()
+
+        def failing_segments():
+            for i in range(200):
+                yield TranscriptSegment(f"字幕{i}", i * 10.0, i * 10.0 + 3.0, 1.0)
+            raise RuntimeError("transcription failed")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = Path(temp_dir) / "movie.srt"
+            output_path.write_text("previous subtitles", encoding='utf-8')
+
+            with pytest.raises(RuntimeError):
+                generator.generate_srt(failing_segments(), output_path)
+
+            assert output_path.read_text(encoding='utf-8') == "previous subtitles"
+            assert [p.name for p in Path(temp_dir).iterdir()] == ["movie.srt"]
+
     def test_empty_segments(self):
         """Test handling of empty segment list."""
         generator = SubtitleGenerator()